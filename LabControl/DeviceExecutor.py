@@ -0,0 +1,182 @@
+r"""
+One worker thread and request queue per physical device
+
+The vendor DLLs are not safe for concurrent calls on one device, so every call to a device runs on its worker,
+in the order it was submitted, while calls to different devices run in parallel.
+"""
+import collections
+import threading
+import time
+from concurrent.futures import Future
+
+
+class _Request:
+    __slots__ = ('function', 'args', 'kwargs', 'future', 'enqueued', 'coalescing')
+
+    def __init__(self, function, args, kwargs, coalescing):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future()
+        self.enqueued = time.perf_counter()
+        self.coalescing = coalescing
+
+
+class DeviceMetrics:
+    """The queue depth and latencies of a device worker. Times are in seconds"""
+
+    def __init__(self):
+        self.depth = 0
+        self.max_depth = 0
+        self.submitted = 0
+        self.coalesced = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_run = 0.0
+        self.max_run = 0.0
+
+    def snapshot(self):
+        done = self.completed + self.failed
+        return {
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'submitted': self.submitted,
+            'coalesced': self.coalesced,
+            'completed': self.completed,
+            'failed': self.failed,
+            'mean_wait': self.total_wait / done if done else 0.0,
+            'max_wait': self.max_wait,
+            'mean_run': self.total_run / done if done else 0.0,
+            'max_run': self.max_run,
+        }
+
+
+class DeviceWorker:
+    """
+    The thread that makes every call to one device
+
+    :param name: The name of the device, for the thread and the metrics
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._requests = collections.deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._metrics = DeviceMetrics()
+        self._thread = threading.Thread(target=self._run, name='device %s' % name, daemon=True)
+        self._thread.start()
+
+    def submit(self, function, *args, **kwargs):
+        """
+        :return: The Future of function(*args, **kwargs), called on the worker after the calls submitted before it
+        """
+        return self._submit(_Request(function, args, kwargs, False))
+
+    def submit_values(self, function, dic):
+        """
+        Submit function(dic), like setValues, coalesced with the last queued call of the same function:
+        if that call has not started, dic is merged into its values, the latest value of every key wins,
+        and both share its result
+
+        :return: The Future of the call
+        """
+        with self._condition:
+            last = self._requests[-1] if self._requests else None
+            if last is not None and last.coalescing and last.function == function:
+                last.args[0].update(dic)
+                self._metrics.submitted += 1
+                self._metrics.coalesced += 1
+                return last.future
+        return self._submit(_Request(function, (dict(dic),), {}, True))
+
+    def _submit(self, request):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('the worker of %s is closed' % self.name)
+            self._requests.append(request)
+            metrics = self._metrics
+            metrics.submitted += 1
+            metrics.depth = len(self._requests)
+            metrics.max_depth = max(metrics.max_depth, metrics.depth)
+            self._condition.notify()
+        return request.future
+
+    def metrics(self):
+        with self._condition:
+            return self._metrics.snapshot()
+
+    def close(self, wait=True):
+        """Stop the worker once the calls already submitted are done"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if wait and threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._requests and not self._closed:
+                    self._condition.wait()
+                if not self._requests:
+                    return
+                request = self._requests.popleft()
+                self._metrics.depth = len(self._requests)
+            if not request.future.set_running_or_notify_cancel():
+                continue
+            started = time.perf_counter()
+            try:
+                result = request.function(*request.args, **request.kwargs)
+            except BaseException as e:
+                request.future.set_exception(e)
+                failed = True
+            else:
+                request.future.set_result(result)
+                failed = False
+            finished = time.perf_counter()
+            with self._condition:
+                metrics = self._metrics
+                if failed:
+                    metrics.failed += 1
+                else:
+                    metrics.completed += 1
+                metrics.total_wait += started - request.enqueued
+                metrics.max_wait = max(metrics.max_wait, started - request.enqueued)
+                metrics.total_run += finished - started
+                metrics.max_run = max(metrics.max_run, finished - started)
+
+
+class DeviceExecutor:
+    """The workers of all the devices, created on the first call to each device"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._workers = {}
+
+    def worker(self, device):
+        """
+        :param device: The name of a physical device, e.g. 'SA124B:19184645'
+        """
+        with self._lock:
+            worker = self._workers.get(device)
+            if worker is None:
+                worker = self._workers[device] = DeviceWorker(device)
+            return worker
+
+    def metrics(self):
+        """
+        :return: The metrics of every device worker, by device name
+        """
+        with self._lock:
+            workers = list(self._workers.values())
+        return {worker.name: worker.metrics() for worker in workers}
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            workers = list(self._workers.values())
+            self._workers.clear()
+        for worker in workers:
+            worker.close(wait)
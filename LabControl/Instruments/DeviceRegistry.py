@@ -0,0 +1,155 @@
+import threading
+
+# seconds a device handle stays open after its last instrument stopped, so reconnecting clients reuse it
+IDLE_TIMEOUT = 60.0
+
+_discoveries = []
+
+
+class DeviceDiscovery:
+    """
+    The devices a driver finds, scanned on first use and cached until rescan
+
+    :param scan: Returns the devices connected, as a dict by serial number
+    """
+
+    def __init__(self, scan):
+        self._scan = scan
+        self._lock = threading.Lock()
+        self._devices = None
+        _discoveries.append(self)
+
+    def devices(self):
+        with self._lock:
+            if self._devices is None:
+                self._devices = self._scan()
+            return self._devices
+
+    def rescan(self):
+        with self._lock:
+            self._devices = None
+        return self.devices()
+
+    def find(self, serialNumber):
+        """
+        :return: The device of serialNumber, rescanning once for a device plugged in since the last scan
+        """
+        devices = self.devices()
+        if serialNumber not in devices:
+            devices = self.rescan()
+        if serialNumber not in devices:
+            raise KeyError('no device with serial number %s, found %s' % (serialNumber, list(devices)))
+        return devices[serialNumber]
+
+
+def rescan():
+    """Forget the devices found by every driver loaded, they are scanned again on their next use"""
+    for discovery in _discoveries:
+        with discovery._lock:
+            discovery._devices = None
+
+
+class _Entry:
+    def __init__(self):
+        self.handle = None
+        self.error = None
+        self.users = 0
+        self.timer = None
+        # set once the device is opened, or failed to open
+        self.opened = threading.Event()
+
+
+class HandlePool:
+    """
+    The open handles of a driver by serial number, shared by all the instruments of a device,
+    across clients. A handle is closed once it had no users for idle_timeout seconds.
+    Devices are opened and closed outside the lock of the pool, so opening one does not hold up the others
+
+    :param open: Opens the device of a serial number and returns its handle
+    :param close: Closes a handle
+    :param idle: Called with the handle when its last user releases it, e.g. to abort an acquisition
+    :param idle_timeout: Seconds, IDLE_TIMEOUT if None
+    """
+
+    def __init__(self, open, close, idle=None, idle_timeout=None):
+        self._open = open
+        self._close = close
+        self._idle = idle
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._entries = {}
+        # the serial numbers of the handles being closed, the device is opened again once closed
+        self._closing = {}
+
+    def acquire(self, serialNumber):
+        """
+        :return: The handle of the device, opened if it is not open. Release it with release
+        """
+        with self._lock:
+            entry = self._entries.get(serialNumber)
+            opening = entry is None
+            if opening:
+                entry = self._entries[serialNumber] = _Entry()
+                closing = self._closing.get(serialNumber)
+            if entry.timer is not None:
+                entry.timer.cancel()
+                entry.timer = None
+            entry.users += 1
+        if not opening:
+            entry.opened.wait()
+            if entry.error is not None:
+                raise entry.error
+            return entry.handle
+        try:
+            if closing is not None:
+                closing.wait()
+            entry.handle = self._open(serialNumber)
+        except BaseException as e:
+            entry.error = e
+            with self._lock:
+                if self._entries.get(serialNumber) is entry:
+                    del self._entries[serialNumber]
+            raise
+        finally:
+            entry.opened.set()
+        return entry.handle
+
+    def release(self, serialNumber):
+        with self._lock:
+            entry = self._entries[serialNumber]
+            entry.users -= 1
+            if entry.users > 0:
+                return
+            timeout = IDLE_TIMEOUT if self.idle_timeout is None else self.idle_timeout
+            entry.timer = threading.Timer(timeout, self._close_idle, (serialNumber, entry))
+            entry.timer.daemon = True
+            entry.timer.start()
+        if self._idle is not None:
+            self._idle(entry.handle)
+
+    def _close_idle(self, serialNumber, entry):
+        with self._lock:
+            # acquired again, or closed, since the timer started
+            if entry.users > 0 or self._entries.get(serialNumber) is not entry:
+                return
+            del self._entries[serialNumber]
+            closed = self._closing[serialNumber] = threading.Event()
+        try:
+            self._close(entry.handle)
+        finally:
+            with self._lock:
+                if self._closing.get(serialNumber) is closed:
+                    del self._closing[serialNumber]
+            closed.set()
+
+    def close_all(self):
+        """Close every handle now, also the ones in use"""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            if entry.timer is not None:
+                entry.timer.cancel()
+            entry.opened.wait()
+            if entry.error is None:
+                self._close(entry.handle)
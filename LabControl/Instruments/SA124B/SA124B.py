@@ -1,5 +1,6 @@
 
 from .sadevice.sa_api import *
+from ..DeviceRegistry import HandlePool
 import numpy as np
 
 SA124Bdoc = """
@@ -113,10 +114,22 @@ the full scale units are specified, no corrections are applied to the data and a
 from the full scale input.
 """
 
+def _open(serialNumber):
+    handle = sa_open_device_by_serial(serialNumber)["handle"]
+    # extra
+    sa_set_timebase(handle, 2)
+    sa_config_RBW_shape(handle, SA_RBW_SHAPE_FLATTOP)
+    return handle
+
+# the acquisition stops once no instrument of the device uses it, not when one of them stops
+handles = HandlePool(_open, sa_close_device, idle=sa_abort)
+
 class SA124B:
     SA124Bdoc
     def __init__(self, serialNumber, mode, name=None):
-        handle = self.handle = sa_open_device_by_serial(serialNumber)["handle"]
+        # reuses the handle of the device if it is open, see HandlePool
+        self.serialNumber = serialNumber
+        self.handle = handles.acquire(serialNumber)
         self.mode = mode
 
         self.name = name or 'SA124B: %d' % serialNumber
@@ -131,12 +144,10 @@ class SA124B:
             self.data = { **self.data, 'IQ': {'actions': ['get'], 'hint': 'type: array' } }
         if mode =='sweep':
             self.data = { **self.data, 'sweep': {'actions': ['get'], 'hint': 'type: array' } }
-
-        # extra
-        sa_set_timebase(handle, 2)
-        sa_config_RBW_shape(handle, SA_RBW_SHAPE_FLATTOP)
     
     def start(self):
+        if self.handle is None:
+            self.handle = handles.acquire(self.serialNumber)
         modes = {'IQ': SA_IQ, 'sweep': SA_SWEEPING}
         sa_initiate(self.handle, modes[self.mode], 0)
         return 'success', 0
@@ -175,13 +186,29 @@ class SA124B:
         return 'success', res
 
     def stop(self):
-        handle = self.handle
-        sa_close_device(handle)
+        # the acquisition is aborted, and the handle closed a while later, once no instrument uses the device
+        if self.handle is not None:
+            handles.release(self.serialNumber)
+            self.handle = None
         return 'success', 0
 
     #=====================================
     # device specific 
     #=====================================
+    def acquireSweep(self):
+        # the values of getValues(['sweep']), in arrays the driver fills without copying them.
+        # The sweep info is queried for every sweep, the handle is shared with the instruments of other clients
+        # which may change the sweep length, and saGetSweep_64f writes sweep_length values whatever the arrays hold
+        sweep_info = sa_query_sweep_info(self.handle)
+        length = sweep_info['sweep_length']
+        sweep_min = np.empty(length, dtype=np.float64)
+        sweep_max = np.empty(length, dtype=np.float64)
+        status = saGetSweep_64f(self.handle, sweep_min, sweep_max)
+        # raised, not exited on like error_check does, so a publisher of the sweeps stops with the error
+        if status < 0:
+            raise Exception('Error %d: %s in saGetSweep_64f()' % (status, saGetErrorString(status).decode()))
+        return {'sweep_info': sweep_info, 'sweep': {'status': status, 'min': sweep_min, 'max': sweep_max}}
+
     def getFreqsAndAmps(self, val):
         info = val['sweep_info']
         freqs = np.array([info["start_freq"] + i * info["bin_size"] for i in range(info["sweep_length"])])
@@ -1,5 +1,21 @@
 
-from .LabBrick.LabBrick import LabBrick
-from .SA124B.SA124B import SA124B
-from .SC5511A.SC5511A import SC5511A
-from .SC5503B.SC5503B import SC5503B
\ No newline at end of file
+import importlib
+from .DeviceRegistry import rescan
+
+# the drivers load their DLL when imported, so each one is imported on its first use
+_drivers = {
+    'LabBrick': '.LabBrick.LabBrick',
+    'SA124B': '.SA124B.SA124B',
+    'SC5511A': '.SC5511A.SC5511A',
+    'SC5503B': '.SC5503B.SC5503B',
+}
+
+def __getattr__(name):
+    if name not in _drivers:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(_drivers[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()).union(_drivers))
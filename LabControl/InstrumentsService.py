@@ -0,0 +1,399 @@
+r"""
+The instruments server, and the client of its instruments
+
+Every call to an instrument is one round-trip. Arguments and results travel by value, in one message where numpy
+arrays are sent as their raw bytes (optionally compressed) with their dtype and shape, instead of the per-element
+proxies of the rpyc classic mode. Start the server with startInstrumentsServer.bat, then::
+
+    import InstrumentsService
+    Instruments = InstrumentsService.connect("localhost")
+    sa124B = Instruments.SA124B(serialNumber = 19184645, mode = 'sweep')
+    sa124B.getValues()
+
+Values are limited to what the message holds: numbers, strings, booleans, None, lists, tuples, dicts with string
+keys, and numpy arrays and scalars.
+"""
+import collections
+import importlib
+import itertools
+import json
+import socket
+import struct
+import zlib
+
+import numpy as np
+import rpyc
+from rpyc.core.stream import SocketStream
+from rpyc.utils.classic import DEFAULT_SERVER_PORT
+
+from DeviceExecutor import DeviceExecutor
+from SweepStreaming import PublisherRegistry
+
+# arrays smaller than this are not worth compressing
+COMPRESS_MIN_BYTES = 1 << 12
+
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+# ========== messages ==========
+def pack(value, compress=False):
+    """
+    :param value: The value to send
+    :param compress: Compress the numpy arrays of at least COMPRESS_MIN_BYTES
+    :return: The message holding value, bytes
+    """
+    buffers = []
+    offset = [0]
+
+    def encode(val):
+        if val is None or isinstance(val, (bool, int, float, str)):
+            return val
+        if isinstance(val, np.generic):
+            return encode(val.item())
+        if isinstance(val, complex):
+            return {'__complex__': [val.real, val.imag]}
+        if isinstance(val, np.ndarray):
+            data = np.ascontiguousarray(val).tobytes()
+            compressed = compress and len(data) >= COMPRESS_MIN_BYTES
+            if compressed:
+                data = zlib.compress(data, 1)
+            buffers.append(data)
+            offset[0] += len(data)
+            return {'__ndarray__': [val.dtype.str, list(val.shape), offset[0] - len(data), len(data), compressed]}
+        if isinstance(val, tuple):
+            return {'__tuple__': [encode(v) for v in val]}
+        if isinstance(val, list):
+            return [encode(v) for v in val]
+        if isinstance(val, dict):
+            for key in val:
+                if not isinstance(key, str):
+                    raise TypeError('only string keys can be sent, got %r' % (key,))
+            return {key: encode(v) for key, v in val.items()}
+        raise TypeError('%s values can not be sent' % type(val).__name__)
+
+    header = json.dumps(encode(value)).encode()
+    return b''.join([_HEADER_LENGTH.pack(len(header)), header] + buffers)
+
+
+def unpack(message):
+    """
+    :param message: A message made by pack
+    :return: The value it holds. Its numpy arrays are writable copies, not views of the message
+    """
+    (length,) = _HEADER_LENGTH.unpack_from(message)
+    payload = memoryview(message)[_HEADER_LENGTH.size + length:]
+
+    def decode(val):
+        if isinstance(val, list):
+            return [decode(v) for v in val]
+        if not isinstance(val, dict):
+            return val
+        if '__ndarray__' in val:
+            dtype, shape, start, size, compressed = val['__ndarray__']
+            data = payload[start:start + size]
+            if compressed:
+                data = zlib.decompress(data)
+            # a single copy out of the message, or out of the decompressed bytes
+            return np.frombuffer(data, dtype=np.dtype(dtype)).reshape(shape).copy()
+        if '__tuple__' in val:
+            return tuple(decode(v) for v in val['__tuple__'])
+        if '__complex__' in val:
+            return complex(*val['__complex__'])
+        return {key: decode(v) for key, v in val.items()}
+
+    return decode(json.loads(bytes(memoryview(message)[_HEADER_LENGTH.size:_HEADER_LENGTH.size + length])))
+
+
+def raw_channel(conn):
+    """
+    Send the messages of an rpyc connection as they are. The channel would zlib every message again, after pack
+    compressed the arrays that are worth it, and Nagle's algorithm would hold the end of every large message until
+    the delayed ACK of the other side
+    """
+    conn._channel.compress = False
+    sock = getattr(conn._channel.stream, 'sock', None)
+    if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+# ========== server ==========
+# the device workers of the server, shared by all its connections
+default_executor = DeviceExecutor()
+# the continuous acquisitions of the server, one by device and method for all the connections subscribed to it
+default_publishers = PublisherRegistry()
+
+
+def device_name(kind, kwargs):
+    """
+    :return: The name of the physical device an instrument of kind opens with kwargs
+    """
+    return '%s:%s' % (kind, kwargs.get('serialNumber'))
+
+
+class InstrumentsService(rpyc.Service):
+    """
+    The rpyc service of the instruments server. Each connection owns the instruments it opens, until it closes them.
+    A stopped instrument can be started again. The ones it did not stop are stopped when it disconnects.
+    The calls to an instrument run on the worker of its device, see DeviceExecutor
+
+    :param instruments: The instrument classes by name, the classes of the Instruments package if None
+    :param executor: The device workers, the ones of the server if None
+    :param publishers: The continuous acquisitions, the ones of the server if None
+    """
+
+    def __init__(self, instruments=None, executor=None, publishers=None):
+        super().__init__()
+        self._classes = instruments
+        self._executor = executor or default_executor
+        self._publishers = publishers or default_publishers
+        self._instruments = {}
+        # the ids of the instruments stopped, and not started since
+        self._stopped = set()
+        # the publisher key each instrument is subscribed to, by instrument id
+        self._subscriptions = {}
+        self._ids = itertools.count()
+
+    def on_connect(self, conn):
+        raw_channel(conn)
+
+    def on_disconnect(self, conn):
+        for id_ in list(self._subscriptions):
+            self.exposed_unpublish(id_)
+        for id_, (instrument, worker) in list(self._instruments.items()):
+            if id_ in self._stopped:
+                continue
+            try:
+                worker.submit(instrument.stop).result()
+            except Exception:
+                pass
+        self._instruments.clear()
+        self._stopped.clear()
+
+    def _call(self, id_, method, *args):
+        instrument, worker = self._instruments[id_]
+        return worker.submit(getattr(instrument, method), *args).result()
+
+    def _instrument_class(self, kind):
+        if self._classes is None:
+            # loads the drivers of every instrument, and their DLLs
+            self._classes = importlib.import_module('Instruments')
+        if isinstance(self._classes, dict):
+            return self._classes[kind]
+        return getattr(self._classes, kind)
+
+    def exposed_open(self, kind, kwargs):
+        kwargs = unpack(kwargs)
+        worker = self._executor.worker(device_name(kind, kwargs))
+        instrument = worker.submit(self._instrument_class(kind), **kwargs).result()
+        id_ = next(self._ids)
+        self._instruments[id_] = (instrument, worker)
+        return id_, pack({'name': instrument.name, 'data': instrument.data})
+
+    def exposed_start(self, id_):
+        result = self._call(id_, 'start')
+        self._stopped.discard(id_)
+        return pack(result)
+
+    def exposed_setValues(self, id_, dic):
+        # the latest value of every key wins over the ones still queued for the device
+        instrument, worker = self._instruments[id_]
+        return pack(worker.submit_values(instrument.setValues, unpack(dic)).result())
+
+    def exposed_getValues(self, id_, keys=None, compress=False):
+        keys = None if keys is None else unpack(keys)
+        return pack(self._call(id_, 'getValues', keys), compress)
+
+    def exposed_stop(self, id_):
+        self.exposed_unpublish(id_)
+        result = self._call(id_, 'stop')
+        self._stopped.add(id_)
+        return pack(result)
+
+    def exposed_close(self, id_):
+        """Stop the instrument if it is not stopped, and forget it"""
+        if id_ not in self._stopped:
+            self.exposed_stop(id_)
+        del self._instruments[id_]
+        self._stopped.discard(id_)
+
+    def exposed_call(self, id_, method, args, compress=False):
+        args, kwargs = unpack(args)
+        instrument, worker = self._instruments[id_]
+        return pack(worker.submit(getattr(instrument, method), *args, **kwargs).result(), compress)
+
+    def exposed_publish(self, id_, method, capacity):
+        """
+        Subscribe the instrument to the continuous acquisition of method on its device, started if it is not,
+        or if it failed. The subscribers of all the connections to the device share it, see
+        SweepStreaming.PublisherRegistry
+
+        :return: The generation of the publisher
+        """
+        instrument, worker = self._instruments[id_]
+        key = (worker.name, method)
+        if self._subscriptions.get(id_, key) != key:
+            self.exposed_unpublish(id_)
+        acquire = getattr(instrument, method)
+        # every acquisition is a call on the device worker, so other calls to the device run between them
+        generation = self._publishers.subscribe(key, (self, id_), lambda: worker.submit(acquire).result(), capacity)
+        self._subscriptions[id_] = key
+        return generation
+
+    def exposed_read(self, id_, generation, after, timeout, compress=False):
+        """
+        :param generation: The generation of the publisher after is numbered in, after is ignored for other ones
+        """
+        if id_ not in self._subscriptions:
+            raise Exception('subscription closed, the instrument %s is not published' % id_)
+        generation, items, dropped = self._publishers.read(self._subscriptions[id_], generation, after, timeout)
+        return pack({'generation': generation, 'items': items, 'dropped': dropped}, compress)
+
+    def exposed_unpublish(self, id_):
+        key = self._subscriptions.pop(id_, None)
+        if key is not None:
+            self._publishers.unsubscribe(key, (self, id_))
+
+    def exposed_metrics(self):
+        return pack(self._executor.metrics())
+
+    def exposed_rescan(self):
+        importlib.import_module('Instruments').rescan()
+
+
+# ========== client ==========
+class RemoteInstrument:
+    """
+    An instrument of the instruments server, with the methods of the instrument class.
+    name and data are copies taken when it was opened
+    """
+
+    def __init__(self, conn, id_, description, compress):
+        self._conn = conn
+        self._id = id_
+        self._compress = compress
+        self.name = description['name']
+        self.data = description['data']
+
+    def start(self):
+        return unpack(self._conn.root.start(self._id))
+
+    def setValues(self, dic):
+        return unpack(self._conn.root.setValues(self._id, pack(dic)))
+
+    def getValues(self, keys=None):
+        keys = None if keys is None else pack(list(keys))
+        return unpack(self._conn.root.getValues(self._id, keys, self._compress))
+
+    def stop(self):
+        return unpack(self._conn.root.stop(self._id))
+
+    def close(self):
+        """Stop the instrument if it is not stopped, and release it on the server, it can not be started again"""
+        self._conn.root.close(self._id)
+
+    def subscribe(self, method='acquireSweep', capacity=16, timeout=1.0):
+        """
+        Acquire continuously on the server, e.g. the sweeps of an SA124B, while the client reads the results
+
+        :param method: The method of the instrument that acquires one result
+        :param capacity: The number of results the server keeps for slow readers, the oldest are dropped.
+            Ignored when the device is already acquiring for another subscription
+        :param timeout: Seconds each read waits on the server before it asks again
+        :return: A Subscription, iterating over the results
+        """
+        generation = self._conn.root.publish(self._id, method, capacity)
+        return Subscription(self, generation, timeout)
+
+    def __getattr__(self, method):
+        if method.startswith('_'):
+            raise AttributeError(method)
+
+        def call(*args, **kwargs):
+            return unpack(self._conn.root.call(self._id, method, pack([list(args), kwargs]), self._compress))
+        return call
+
+
+class Subscription:
+    """
+    The results an instrument acquires continuously, iterated over as (sequence number, result).
+    dropped counts the results the server dropped before they were read.
+    Closing it ends the subscriptions to the instrument, the acquisition stops once no client subscribes to its device.
+    Sequence numbers start over when the instrument is published again, by another subscribe
+    """
+
+    def __init__(self, instrument, generation, timeout):
+        self._instrument = instrument
+        self._generation = generation
+        self._timeout = timeout
+        self._after = None
+        self._results = collections.deque()
+        self.dropped = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        instrument = self._instrument
+        while not self._results:
+            read = unpack(instrument._conn.root.read(instrument._id, self._generation, self._after, self._timeout,
+                                                     instrument._compress))
+            if read['generation'] != self._generation:
+                self._generation = read['generation']
+                self._after = None
+            self.dropped += read['dropped']
+            self._results.extend(read['items'])
+        number, result = self._results.popleft()
+        self._after = number
+        return number, result
+
+    def close(self):
+        self._instrument._conn.root.unpublish(self._instrument._id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class InstrumentsClient:
+    """
+    The instruments of an instruments server: InstrumentsClient.SA124B(...) opens an SA124B on the server,
+    with the arguments of the SA124B class
+    """
+
+    def __init__(self, conn, compress=False):
+        self._conn = conn
+        self._compress = compress
+
+    def open(self, kind, **kwargs):
+        id_, description = self._conn.root.open(kind, pack(kwargs))
+        return RemoteInstrument(self._conn, id_, unpack(description), self._compress)
+
+    def metrics(self):
+        """
+        :return: The queue depth and latencies of every device worker of the server, by device name
+        """
+        return unpack(self._conn.root.metrics())
+
+    def rescan(self):
+        """Make the server find the devices plugged in since it last looked for them"""
+        self._conn.root.rescan()
+
+    def close(self):
+        self._conn.close()
+
+    def __getattr__(self, kind):
+        if kind.startswith('_'):
+            raise AttributeError(kind)
+        return lambda **kwargs: self.open(kind, **kwargs)
+
+
+def connect(host='localhost', port=DEFAULT_SERVER_PORT, compress=False):
+    """
+    :param compress: Compress the arrays the server sends back, for slow links
+    :return: The InstrumentsClient of the server at host:port
+    """
+    conn = rpyc.connect_stream(SocketStream.connect(host, port, nodelay=True))
+    raw_channel(conn)
+    return InstrumentsClient(conn, compress)
@@ -0,0 +1,173 @@
+r"""
+Continuous acquisition into a bounded ring buffer, read by any number of subscribers
+
+A Publisher thread acquires items, e.g. the sweeps of an SA124B, as fast as the device makes them and numbers
+them. Subscribers read the items after the last one they got. When they fall behind, the oldest items are
+dropped and the subscribers learn how many they missed. A PublisherRegistry shares one Publisher between all the
+subscribers to a device.
+"""
+import collections
+import itertools
+import threading
+
+
+class RingBuffer:
+    """
+    The latest capacity items put, numbered from 0
+
+    :param capacity: The number of items kept, the oldest ones are dropped
+    """
+
+    def __init__(self, capacity):
+        self._items = collections.deque(maxlen=capacity)
+        self._condition = threading.Condition()
+        self._next = 0
+        self.closed = False
+
+    def put(self, item):
+        with self._condition:
+            self._items.append((self._next, item))
+            self._next += 1
+            self._condition.notify_all()
+
+    def read(self, after=None, timeout=None):
+        """
+        Wait for the items after an item number
+
+        :param after: The number of the last item the reader got, None for a reader that got none yet
+        :param timeout: Seconds to wait for an item, None to wait until there is one or the buffer is closed
+        :return: The items kept after after, as (number, item) from the oldest, and the number of items after after
+            that were already dropped
+        """
+        last = -1 if after is None else after
+        with self._condition:
+            self._condition.wait_for(lambda: self._next - 1 > last or self.closed, timeout)
+            items = [(number, item) for (number, item) in self._items if number > last]
+            if after is None:
+                return items, 0
+            first = items[0][0] if items else self._next
+            return items, first - last - 1
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+
+class Publisher:
+    """
+    A thread that puts the items acquire returns into a RingBuffer, until it is stopped or acquire fails
+
+    :param acquire: Returns the next item, waiting for it
+    :param capacity: The capacity of the ring buffer
+    """
+
+    def __init__(self, acquire, capacity=16):
+        self.buffer = RingBuffer(capacity)
+        self.error = None
+        self._acquire = acquire
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='publisher', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                self.buffer.put(self._acquire())
+        except Exception as e:
+            self.error = e
+        finally:
+            self.buffer.close()
+
+    def read(self, after=None, timeout=None):
+        """
+        See RingBuffer.read. Raises the error of acquire once the items before it were read
+        """
+        items, dropped = self.buffer.read(after, timeout)
+        if not items and self.error is not None:
+            raise self.error
+        return items, dropped
+
+    def stop(self):
+        """Stop acquiring, once the acquisition in progress is done"""
+        self._stopped.set()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+
+class _Publication:
+    def __init__(self):
+        self.publisher = None
+        self.generation = None
+        # the acquire function of every subscriber, any of them acquires for all
+        self.subscribers = {}
+
+
+class PublisherRegistry:
+    """
+    The publishers of a server by key, e.g. a device and the method acquiring on it, shared by all the subscribers
+    to the key, across connections. A publisher acquires with the function of any of its subscribers, and stops
+    once the last one unsubscribes. Each publisher of a key has a new generation number, its item numbers start over
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._publications = {}
+        self._generations = itertools.count()
+
+    def subscribe(self, key, subscriber, acquire, capacity=16):
+        """
+        Start the publisher of key if it is not started, or if its acquisition failed
+
+        :param subscriber: A hashable id of the subscriber, subscribing again does not count it twice
+        :param acquire: The function the publisher may acquire with for this subscriber, see Publisher
+        :param capacity: The capacity of the ring buffer of a new publisher
+        :return: The generation of the publisher
+        """
+        failed = None
+        with self._lock:
+            publication = self._publications.setdefault(key, _Publication())
+            publication.subscribers[subscriber] = acquire
+            if publication.publisher is None or publication.publisher.buffer.closed:
+                failed = publication.publisher
+                publication.publisher = Publisher(lambda: self._acquire(publication), capacity)
+                publication.generation = next(self._generations)
+            generation = publication.generation
+        if failed is not None:
+            failed.stop()
+        return generation
+
+    def _acquire(self, publication):
+        with self._lock:
+            if not publication.subscribers:
+                raise RuntimeError('no subscribers left')
+            acquire = next(iter(publication.subscribers.values()))
+        return acquire()
+
+    def read(self, key, generation, after=None, timeout=None):
+        """
+        See Publisher.read
+
+        :param generation: The generation of the publisher after is numbered in, after is ignored for other ones
+        :return: The generation of the publisher of key, its items and the number of items dropped
+        """
+        with self._lock:
+            publication = self._publications.get(key)
+            if publication is None:
+                raise Exception('subscription closed, %s is not published' % (key,))
+            publisher, current = publication.publisher, publication.generation
+        if generation != current:
+            after = None
+        items, dropped = publisher.read(after, timeout)
+        return current, items, dropped
+
+    def unsubscribe(self, key, subscriber):
+        """Stop the publisher of key if subscriber was its last subscriber"""
+        with self._lock:
+            publication = self._publications.get(key)
+            if publication is None or publication.subscribers.pop(subscriber, None) is None:
+                return
+            if publication.subscribers:
+                return
+            del self._publications[key]
+        publication.publisher.stop()
@@ -0,0 +1,156 @@
+r"""
+Latency and throughput of the instruments service against the rpyc classic mode, with a fake spectrum analyzer
+served in-process by both, and the scaling of concurrent scans over several analyzers. Run from LabControl::
+
+    python -m benchmarks.bench_instruments_rpc --points 100000 --repeat 20 --devices 4 --sweep-ms 20
+
+"""
+import argparse
+import statistics
+import threading
+import time
+
+import numpy as np
+import rpyc
+from rpyc.core import SlaveService
+from rpyc.utils.helpers import classpartial
+from rpyc.utils.server import ThreadedServer
+
+import InstrumentsService
+
+
+class FakeAnalyzer:
+    """Sweeps like the SA124B in sweep mode, without the device"""
+
+    def __init__(self, points, serialNumber=0, sweep_time=0.0, name=None):
+        self.name = name or 'FakeAnalyzer: %d' % serialNumber
+        self.sweep_time = sweep_time
+        self.data = {
+            'level': {'actions': ['set', 'get'], 'hint': 'type: number'},
+            'sweep': {'actions': ['get'], 'hint': 'type: array'},
+        }
+        self.values = {}
+        self.points = points
+
+    def start(self):
+        return 'success', 0
+
+    def setValues(self, dic):
+        self.values.update(dic)
+        return 'success', 0
+
+    def getValues(self, keys=None):
+        res = dict(self.values)
+        if keys is None or 'sweep' in keys:
+            # the device is busy while it sweeps, like the DLL calls block
+            time.sleep(self.sweep_time)
+            res['sweep_info'] = {'sweep_length': self.points, 'start_freq': 6e9, 'bin_size': 10.0}
+            res['sweep'] = {'min': np.random.rand(self.points), 'max': np.random.rand(self.points)}
+        return 'success', res
+
+    def stop(self):
+        return 'success', 0
+
+
+def serve(service):
+    server = ThreadedServer(service, hostname='127.0.0.1', port=0, reuse_addr=True,
+                            protocol_config={'allow_public_attrs': True})
+    threading.Thread(target=server.start, daemon=True).start()
+    # start listens in the thread, connecting before it does is refused
+    while not server.active:
+        time.sleep(0.01)
+    return server
+
+
+def measure(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), min(times)
+
+
+def report(name, median, best, size_bytes=None):
+    line = '%-40s median %10.3f ms   best %10.3f ms' % (name, median * 1e3, best * 1e3)
+    if size_bytes is not None:
+        line += '   %10.1f MB/s median' % (size_bytes / median / 1e6)
+    print(line)
+
+
+def fetch_sweep(analyzer, copy):
+    """Get the values of an analyzer, with the min and max arrays of its sweep copied to this process by copy"""
+    sweep = analyzer.getValues()[1]['sweep']
+    return copy(sweep['min']), copy(sweep['max'])
+
+
+def scan(port, devices, args):
+    """
+    :return: The sweeps per second of all the devices together, scanned concurrently
+    """
+    def run(serialNumber):
+        instruments = InstrumentsService.connect('127.0.0.1', port)
+        analyzer = instruments.FakeAnalyzer(points=1000, serialNumber=serialNumber, sweep_time=args.sweep_ms / 1e3)
+        for _ in range(args.repeat):
+            analyzer.getValues(['sweep'])
+        analyzer.stop()
+        instruments.close()
+
+    threads = [threading.Thread(target=run, args=(serialNumber,)) for serialNumber in range(devices)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return devices * args.repeat / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, default=100000, help='points of every sweep')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--devices', type=int, default=4, help='analyzers scanned concurrently')
+    parser.add_argument('--sweep-ms', type=float, default=20.0, help='acquisition time of a concurrent scan sweep')
+    args = parser.parse_args()
+    # every mode fetches the min and max arrays of a sweep, as getValues returns them
+    sweep_bytes = 2 * 8 * args.points
+
+    classic_server = serve(SlaveService)
+    service_server = serve(classpartial(InstrumentsService.InstrumentsService, {'FakeAnalyzer': FakeAnalyzer}))
+    try:
+        # the classic mode, as the tutorials used it: the instrument and its results are netrefs
+        conn = rpyc.classic.connect('127.0.0.1', classic_server.port)
+        analyzer = conn.modules[__name__].FakeAnalyzer(args.points)
+        report('classic setValues', *measure(lambda: analyzer.setValues({'level': -10.0}), args.repeat))
+        report('classic getValues, np.array(sweep)', *measure(
+            lambda: fetch_sweep(analyzer, np.array), args.repeat), sweep_bytes)
+        report('classic getValues, obtain(sweep)', *measure(
+            lambda: fetch_sweep(analyzer, rpyc.classic.obtain), args.repeat), sweep_bytes)
+        conn.close()
+
+        for compress in (False, True):
+            instruments = InstrumentsService.connect('127.0.0.1', service_server.port, compress=compress)
+            analyzer = instruments.FakeAnalyzer(points=args.points)
+            suffix = ', compressed' if compress else ''
+            report('service setValues' + suffix, *measure(lambda: analyzer.setValues({'level': -10.0}), args.repeat))
+            # the arrays are already copies in this process, see InstrumentsService.unpack
+            report('service getValues' + suffix, *measure(
+                lambda: fetch_sweep(analyzer, lambda array: array), args.repeat), sweep_bytes)
+            analyzer.stop()
+            instruments.close()
+
+        # one client per analyzer, every scan waits for the acquisition of its own device only
+        for devices in sorted({1, args.devices}):
+            print('%-40s %10.1f sweeps/s' % ('service scan, %d device(s)' % devices, scan(service_server.port, devices, args)))
+        instruments = InstrumentsService.connect('127.0.0.1', service_server.port)
+        for name, metrics in sorted(instruments.metrics().items()):
+            print('    %-30s max depth %3d   mean wait %8.3f ms   mean run %8.3f ms' % (
+                name, metrics['max_depth'], metrics['mean_wait'] * 1e3, metrics['mean_run'] * 1e3))
+        instruments.close()
+    finally:
+        classic_server.close()
+        service_server.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,9 @@ from rpyc.utils.registry import UDPRegistryClient, TCPRegistryClient
 from rpyc.utils.authenticators import SSLAuthenticator
 from rpyc.lib import setup_logger
 from rpyc.core import SlaveService
+from rpyc.utils.factory import connect_pipes
+
+from InstrumentsService import InstrumentsService
 
 
 class ClassicServer(cli.Application):
@@ -24,6 +27,9 @@ class ClassicServer(cli.Application):
                           "The default is localhost", group="Socket Options")
     ipv6 = cli.Flag(["--ipv6"], help="Enable IPv6", group="Socket Options")
 
+    classic = cli.Flag(["--classic"], help="Serve the rpyc classic mode, where clients use the Instruments "
+                       "package remotely, instead of the instruments service")
+
     logfile = cli.SwitchAttr("--logfile", str, default=None, help="Specify the log file to use; "
                              "the default is stderr", group="Logging")
     quiet = cli.Flag(["-q", "--quiet"], help="Quiet mode (only errors will be logged)",
@@ -74,6 +80,8 @@ class ClassicServer(cli.Application):
         if self.port is None:
             self.port = default_port
 
+        self.service = SlaveService if self.classic else InstrumentsService
+
         setup_logger(self.quiet, self.logfile)
 
         if self.mode == "threaded":
@@ -86,13 +94,13 @@ class ClassicServer(cli.Application):
             self._serve_stdio()
 
     def _serve_mode(self, factory):
-        t = factory(SlaveService, hostname=self.host, port=self.port,
+        t = factory(self.service, hostname=self.host, port=self.port,
                     reuse_addr=True, ipv6=self.ipv6, authenticator=self.authenticator,
                     registrar=self.registrar, auto_register=self.auto_register)
         t.start()
 
     def _serve_oneshot(self):
-        t = OneShotServer(SlaveService, hostname=self.host, port=self.port,
+        t = OneShotServer(self.service, hostname=self.host, port=self.port,
                           reuse_addr=True, ipv6=self.ipv6, authenticator=self.authenticator,
                           registrar=self.registrar, auto_register=self.auto_register)
         t._listen()
@@ -107,7 +115,10 @@ class ClassicServer(cli.Application):
         sys.stdin = open(os.devnull, "r")
         sys.stdout = open(os.devnull, "w")
         sys.stderr = open(os.devnull, "w")
-        conn = rpyc.classic.connect_pipes(origstdin, origstdout)
+        if self.classic:
+            conn = rpyc.classic.connect_pipes(origstdin, origstdout)
+        else:
+            conn = connect_pipes(origstdin, origstdout, service=self.service)
         try:
             try:
                 conn.serve_all()
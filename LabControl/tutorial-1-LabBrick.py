@@ -1,8 +1,8 @@
 
-import rpyc
+import InstrumentsService
 
 # ========== connect to the Instruments Server ==========
-Instruments = rpyc.classic.connect("localhost").modules["Instruments"]
+Instruments = InstrumentsService.connect("localhost")
 
 brick = Instruments.LabBrick(serialNumber = 24352)
 brick.setValues({'freq': 7e9, 'pow': -10})
@@ -1,5 +1,5 @@
 
-import rpyc
+import InstrumentsService
 from scipy.signal import get_window
 import numpy as np
 import matplotlib.pyplot as plt
@@ -28,7 +28,7 @@ def extractSingleFreqFromSweep(val, freq):
     
 
 # ========== connect to the Instruments Server ==========
-Instruments = rpyc.classic.connect("localhost").modules["Instruments"]
+Instruments = InstrumentsService.connect("localhost")
 
 # ========== shared parameters by LabBrick and SA124B ==========
 print(SA124Bdoc)
@@ -57,6 +57,15 @@ for i in range(10):
     powAtCenter = extractSingleFreqFromSweep(val, center_Hz)
     print(powAtCenter)
 plt.show()
+
+# ========== example 3: streaming sweeps ==========
+# the server sweeps continuously while the sweeps are sent, the 16 latest are kept for a slow client
+with sa124B_sweep.subscribe(capacity = 16) as sweeps:
+    for seq, val in sweeps:
+        print(seq, extractSingleFreqFromSweep(val, center_Hz))
+        if seq >= 100:
+            break
+    print('dropped sweeps:', sweeps.dropped)
 sa124B_sweep.stop()
 #brick.stop()
 
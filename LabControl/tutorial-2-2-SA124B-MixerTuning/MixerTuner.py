@@ -18,9 +18,10 @@ class MixerTuner:
         self.power = power
 
     def step1CoarseSweep(self, I=0, Q=0, gain=0, phase=0, span=500e6, N=100):
-        self.qm.set_dc_offset_by_qe("qubit", "I", float(I))
-        self.qm.set_dc_offset_by_qe("qubit", "Q", float(Q))
-        self.qm.set_mixer_correction("mixer_qubit", qubit_IF, qubit_LO, IQ_imbalance(gain, phase))
+        with self.qm.batch_updates():
+            self.qm.set_dc_offset_by_qe("qubit", "I", float(I))
+            self.qm.set_dc_offset_by_qe("qubit", "Q", float(Q))
+            self.qm.set_mixer_correction("mixer_qubit", qubit_IF, qubit_LO, IQ_imbalance(gain, phase))
         freqs, amps = self.sa124B.initSweep(self.carrier, span, N, self.power)
         plt.figure()
         plt.plot(freqs, amps)
@@ -58,8 +59,9 @@ class MixerTuner:
         print('step2CarrierLeakage')
         _, amps = self.sa124B.initSweepSingle(center=self.carrier, power=self.power)
         def callback(I, Q):
-            self.qm.set_dc_offset_by_qe("qubit", "I", float(I))
-            self.qm.set_dc_offset_by_qe("qubit", "Q", float(Q))
+            with self.qm.batch_updates():
+                self.qm.set_dc_offset_by_qe("qubit", "I", float(I))
+                self.qm.set_dc_offset_by_qe("qubit", "Q", float(Q))
         return self.minimize(centers, spans, callback, amps, numIters, numGrids, shrink)
     
     def step3IqImbalance(self, centers, spans, numIters, numGrids, shrink):
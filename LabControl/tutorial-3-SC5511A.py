@@ -1,8 +1,8 @@
 
-import rpyc
+import InstrumentsService
 
 # ========== connect to the Instruments Server ==========
-Instruments = rpyc.classic.connect("localhost").modules["Instruments"]
+Instruments = InstrumentsService.connect("localhost")
 
 dev = Instruments.SC5511A(serialNumber= 10002657 )
 print(dev.start())
@@ -1,8 +1,8 @@
 
-import rpyc
+import InstrumentsService
 
 # ========== connect to the Instruments Server ==========
-Instruments = rpyc.classic.connect("localhost").modules["Instruments"]
+Instruments = InstrumentsService.connect("localhost")
 
 dev = Instruments.SC5503B(serialNumber= 10002656 )
 print(dev.start())
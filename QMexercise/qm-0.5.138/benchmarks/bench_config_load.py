@@ -0,0 +1,77 @@
+"""
+Time to load a config carrying long arbitrary waveforms, given as python lists and as numpy arrays
+
+Run from the package root::
+
+    python -m benchmarks.bench_config_load --samples 1000000 --waveforms 10
+
+"""
+import argparse
+
+import numpy
+
+from benchmarks.bench_results import measure, report
+from qm.program import load_config
+
+
+def synthetic_config(waveforms, digital_samples):
+    """A config with one single input element playing each of the arbitrary `waveforms`"""
+    config = {
+        "version": 1,
+        "controllers": {
+            "con1": {
+                "type": "opx1",
+                "analog_outputs": {1: {"offset": 0.0}},
+                "digital_outputs": {1: {}},
+            }
+        },
+        "elements": {
+            "qubit": {
+                "singleInput": {"port": ("con1", 1)},
+                "intermediate_frequency": 50e6,
+                "operations": {f"op{i}": f"pulse{i}" for i in range(len(waveforms))},
+            }
+        },
+        "pulses": {
+            f"pulse{i}": {
+                "operation": "control",
+                "length": len(samples),
+                "waveforms": {"single": f"wf{i}"},
+                "digital_marker": "marker",
+            }
+            for (i, samples) in enumerate(waveforms)
+        },
+        "waveforms": {f"wf{i}": {"type": "arbitrary", "samples": samples} for (i, samples) in enumerate(waveforms)},
+        "digital_waveforms": {"marker": {"samples": digital_samples}},
+    }
+    return config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=1000000, help="total samples of all the waveforms")
+    parser.add_argument("--waveforms", type=int, default=10, help="number of arbitrary waveforms")
+    parser.add_argument("--digital-samples", type=int, default=1000, help="(value, length) pairs of the marker")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    random = numpy.random.RandomState(0)
+    length = args.samples // args.waveforms
+    arrays = [random.uniform(-0.4, 0.4, length) for _ in range(args.waveforms)]
+    marker = numpy.stack([numpy.arange(args.digital_samples) % 2, numpy.full(args.digital_samples, 4)], axis=1)
+
+    lists = synthetic_config([samples.tolist() for samples in arrays], [tuple(pair) for pair in marker.tolist()])
+    _, median, best = measure(lambda: load_config(lists, use_cache=False), args.repeat)
+    report("load_config, python lists", median, best, items=args.samples)
+
+    numpy_config = synthetic_config(arrays, marker)
+    _, median, best = measure(lambda: load_config(numpy_config, use_cache=False), args.repeat)
+    report("load_config, numpy arrays", median, best, items=args.samples)
+
+    load_config(lists)
+    _, median, best = measure(lambda: load_config(lists), args.repeat)
+    report("load_config, cached", median, best, items=args.samples)
+
+
+if __name__ == "__main__":
+    main()
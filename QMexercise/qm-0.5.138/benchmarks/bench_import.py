@@ -0,0 +1,80 @@
+"""
+Import time of the qm package, measured with ``python -X importtime`` in fresh interpreters
+
+Exits with an error if importing qm loads one of the heavy modules that must load on first use,
+or if it takes longer than ``--max-ms``. Run from the package root::
+
+    python -m benchmarks.bench_import --statement "import qm" --max-ms 50
+
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+# modules that ``import qm`` alone must not load
+HEAVY_MODULES = [
+    "grpc",
+    "numpy",
+    "marshmallow",
+    "qm.pb.inc_qua_pb2",
+    "qm.pb.inc_qua_config_pb2",
+    "qm.pb.frontend_pb2",
+    "qm.pb.job_results_pb2",
+    "qm.QuantumMachine",
+    "qm.program",
+]
+
+
+def import_times(statement: str):
+    """
+    :return: The cumulative import time in microseconds of every top level module imported by `statement`
+    """
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                             stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        (_, cumulative, name) = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def loaded_modules(statement: str):
+    code = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+    process = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, universal_newlines=True,
+                             check=True)
+    return set(process.stdout.splitlines())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--statement", default="import qm", help="the import statement to time")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if the median import time is longer")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest modules to list")
+    args = parser.parse_args()
+
+    runs = [import_times(args.statement) for _ in range(args.repeat)]
+    totals = sorted(sum(times.values()) / 1e3 for times in runs)
+    median = statistics.median(totals)
+    print(f"{args.statement!r:<40} median {median:10.2f} ms   best {totals[0]:10.2f} ms")
+    for (name, cumulative) in sorted(runs[-1].items(), key=lambda item: -item[1])[:args.top]:
+        print(f"    {name:<50} {cumulative / 1e3:10.2f} ms")
+
+    failures = []
+    if args.statement == "import qm":
+        heavy = [name for name in HEAVY_MODULES if name in loaded_modules(args.statement)]
+        if heavy:
+            failures.append(f"import qm loads {', '.join(heavy)}")
+    if args.max_ms is not None and median > args.max_ms:
+        failures.append(f"median import time {median:.2f} ms is over {args.max_ms} ms")
+    for failure in failures:
+        print("FAILED:", failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
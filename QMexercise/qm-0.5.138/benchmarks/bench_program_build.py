@@ -0,0 +1,62 @@
+"""
+Time to build large QUA programs with Python unrolled loops and large declared arrays
+
+Run from the package root::
+
+    python -m benchmarks.bench_program_build --statements 10000 --table-size 100000
+
+"""
+import argparse
+
+import numpy
+
+from benchmarks.bench_results import measure, report
+from qm import _loc
+from qm.qua import program, declare, fixed, play, wait, assign, align, amp, for_each_
+
+
+def build(statements: int):
+    with program() as prog:
+        a = declare(fixed)
+        t = declare(int)
+        for i in range(statements):
+            assign(a, 0.1 + i * 1e-6)
+            assign(t, 4 + i % 100)
+            play("pi" * amp(a), "qubit")
+            wait(t, "qubit")
+            align("qubit", "resonator")
+    return prog
+
+
+def build_tables(frequencies, amplitudes):
+    with program() as prog:
+        f = declare(int)
+        a = declare(fixed)
+        with for_each_((f, a), (frequencies, amplitudes)):
+            play("pi" * amp(a), "qubit")
+    return prog
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--statements", type=int, default=10000, help="iterations of the unrolled loop")
+    parser.add_argument("--table-size", type=int, default=100000, help="values of every for_each_ table")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for capture in (True, False):
+        _loc.set_loc_capture(capture)
+        _, median, best = measure(lambda: build(args.statements), args.repeat)
+        report(f"build, location capture {'on' if capture else 'off'}", median, best, items=5 * args.statements)
+    _loc.set_loc_capture(True)
+
+    frequencies = numpy.arange(args.table_size) * 1000 + 50000000
+    amplitudes = numpy.linspace(-1, 1, args.table_size)
+    for (label, tables) in (("numpy arrays", (frequencies, amplitudes)),
+                            ("lists", (frequencies.tolist(), amplitudes.tolist()))):
+        _, median, best = measure(lambda: build_tables(*tables), args.repeat)
+        report(f"for_each_ tables, {label}", median, best, items=2 * args.table_size)
+
+
+if __name__ == "__main__":
+    main()
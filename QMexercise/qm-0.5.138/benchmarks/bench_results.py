@@ -0,0 +1,118 @@
+"""
+Throughput and latency of the client result paths against the in-process fake server
+
+Run from the package root::
+
+    python -m benchmarks.bench_results --count 1000000 --dtype "<f8" --chunk-size 10000
+
+"""
+import argparse
+import statistics
+import time
+import zipfile
+from io import BytesIO
+from types import SimpleNamespace
+
+import grpc
+
+from benchmarks.fake_server import FakeQmServer, MAX_MESSAGE_SIZE, synthetic_result, synthetic_simulated_samples
+from qm.QmJob import QmJob
+from qm._results import JobResults
+from qm.pb.frontend_pb2_grpc import FrontendStub
+from qm.pb.job_results_pb2_grpc import JobResultsServiceStub
+from qm.persistence import SimpleFileStore
+
+JOB_ID = "bench-job"
+
+
+def measure(function, repeat: int):
+    """
+    :return: The value returned by the last call and the median and best times in seconds
+    """
+    times = []
+    value = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = function()
+        times.append(time.perf_counter() - start)
+    return value, statistics.median(times), min(times)
+
+
+def report(name: str, median: float, best: float, size_bytes: int = None, items: int = None):
+    line = f"{name:<40} median {median * 1e3:10.2f} ms   best {best * 1e3:10.2f} ms"
+    if size_bytes is not None:
+        line += f"   {size_bytes / best / 1e6:10.1f} MB/s"
+    if items is not None:
+        line += f"   {items / best / 1e6:8.2f} M items/s"
+    print(line)
+
+
+def drain(generator):
+    count = 0
+    for _ in generator:
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000000, help="items in every named result")
+    parser.add_argument("--dtype", default="<f8", help="numpy dtype of the named results")
+    parser.add_argument("--results", type=int, default=4, help="number of named results in the job")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="items in every streamed message")
+    parser.add_argument("--duration", type=int, default=1000000, help="simulated samples per port")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with FakeQmServer(chunk_size=args.chunk_size) as server:
+        values = synthetic_result(args.count, args.dtype)
+        names = [f"result{i}" for i in range(args.results)]
+        for name in names:
+            server.add_result(JOB_ID, name, values)
+        samples = synthetic_simulated_samples(args.duration)
+        server.set_simulated_samples(JOB_ID, samples)
+
+        channel = grpc.insecure_channel(server.address, options=[
+            ("grpc.max_receive_message_length", MAX_MESSAGE_SIZE),
+        ])
+        store = SimpleFileStore()
+        results = JobResults(JOB_ID, JobResultsServiceStub(channel), store)
+        handle = results.get(names[0])
+        print(f"{args.results} results of {args.count} items of {values.dtype} "
+              f"({values.nbytes / 1e6:.1f} MB each), {args.chunk_size} items per message")
+
+        _, median, best = measure(lambda: handle.fetch(0), args.repeat)
+        report("fetch one item (latency)", median, best)
+
+        _, median, best = measure(handle.fetch_all, args.repeat)
+        report("fetch_all", median, best, values.nbytes, args.count)
+
+        out = handle.fetch_all()
+        _, median, best = measure(lambda: handle.fetch(slice(0, None), out=out), args.repeat)
+        report("fetch into a reused array", median, best, values.nbytes, args.count)
+
+        _, median, best = measure(lambda: drain(handle.fetcher()()), args.repeat)
+        report("fetcher, item by item", median, best, values.nbytes, args.count)
+
+        _, median, best = measure(lambda: drain(handle.batch_fetcher()()), args.repeat)
+        report("batch_fetcher, chunk by chunk", median, best, values.nbytes, args.count)
+
+        total_bytes = values.nbytes * args.results
+        for (label, compression, level) in [("stored", zipfile.ZIP_STORED, None),
+                                            ("deflate level 1", zipfile.ZIP_DEFLATED, 1),
+                                            ("deflate default", zipfile.ZIP_DEFLATED, None)]:
+            _, median, best = measure(lambda: results.save_to_store(BytesIO(), compression=compression,
+                                                                    compresslevel=level), args.repeat)
+            report(f"save_to_store, {label}", median, best, total_bytes)
+
+        manager = SimpleNamespace(_frontend=FrontendStub(channel), _channel=channel, store=store)
+        job = QmJob(manager, JOB_ID)
+        _, median, best = measure(job.get_simulated_samples, args.repeat)
+        report("get_simulated_samples", median, best, samples.nbytes, args.duration)
+
+        print("server calls:", server.job_results.calls)
+        channel.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+An in-process stand-in for the Frontend and JobResults gRPC services of the QM orchestrator
+
+It serves synthetic named results and simulated samples from memory, so the client data paths can be
+measured without an OPX::
+
+    with FakeQmServer() as server:
+        server.add_result("job", "I", numpy.random.rand(1000000))
+        channel = grpc.insecure_channel(server.address)
+        results = JobResults("job", JobResultsServiceStub(channel), SimpleFileStore())
+
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+import grpc
+import numpy
+from google.protobuf import wrappers_pb2
+
+from qm.pb import frontend_pb2, frontend_pb2_grpc, job_results_pb2, job_results_pb2_grpc
+
+MAX_MESSAGE_SIZE = 1024 * 1024 * 100
+
+
+def _simple_dtype(d_type: numpy.dtype) -> str:
+    return json.dumps(d_type.descr)
+
+
+def synthetic_result(count: int, d_type="<f8", seed: int = 0) -> numpy.ndarray:
+    """Random values of `d_type` that look like a ``save_all`` stream of `count` items"""
+    d_type = numpy.dtype(d_type)
+    random = numpy.random.RandomState(seed)
+    if d_type.names is None:
+        d_type = numpy.dtype([("value", d_type)])
+    values = numpy.empty(count, dtype=d_type)
+    for name in d_type.names:
+        column = values[name]
+        if column.dtype.kind == "f":
+            column[...] = random.randn(*column.shape)
+        elif column.dtype.kind == "b":
+            column[...] = random.randint(0, 2, size=column.shape)
+        else:
+            column[...] = random.randint(0, 1 << 15, size=column.shape)
+    return values
+
+
+def synthetic_simulated_samples(duration: int, analog_ports=(1, 2), digital_ports=(1,),
+                                controller: str = "con1", seed: int = 0) -> numpy.ndarray:
+    """Random samples laid out like the simulator output, one column per controller port"""
+    random = numpy.random.RandomState(seed)
+    d_type = [(f"{controller}:analog:{port}", "<f8") for port in analog_ports]
+    d_type += [(f"{controller}:digital:{port}", "?") for port in digital_ports]
+    samples = numpy.empty(duration, dtype=d_type)
+    for port in analog_ports:
+        samples[f"{controller}:analog:{port}"] = random.uniform(-0.5, 0.5, duration)
+    for port in digital_ports:
+        samples[f"{controller}:digital:{port}"] = random.randint(0, 2, duration)
+    return samples
+
+
+class _NamedResult:
+    def __init__(self, values: numpy.ndarray, is_single: bool, done: bool) -> None:
+        super().__init__()
+        self.values = values
+        self.is_single = is_single
+        self.done = done
+
+
+class FakeJobResultsService(job_results_pb2_grpc.JobResultsServiceServicer):
+    def __init__(self, chunk_size: int) -> None:
+        super().__init__()
+        self.chunk_size = chunk_size
+        self.jobs: Dict[str, Dict[str, _NamedResult]] = {}
+        self.calls: Dict[str, int] = {}
+
+    def _count(self, method: str):
+        self.calls[method] = self.calls.get(method, 0) + 1
+
+    def _result(self, request, context) -> _NamedResult:
+        result = self.jobs.get(request.jobId, {}).get(request.outputName)
+        if result is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, f"no result {request.outputName} in job {request.jobId}")
+        return result
+
+    def GetJobResultSchema(self, request, context):
+        self._count("GetJobResultSchema")
+        response = job_results_pb2.GetJobResultSchemaResponse()
+        for (name, result) in self.jobs.get(request.jobId, {}).items():
+            item = response.items.add()
+            item.name = name
+            item.simpleDType = _simple_dtype(result.values.dtype)
+            item.isSingle = result.is_single
+            item.expectedCount = len(result.values)
+        return response
+
+    def GetJobNamedResultHeader(self, request, context):
+        self._count("GetJobNamedResultHeader")
+        result = self._result(request, context)
+        response = job_results_pb2.GetJobNamedResultHeaderResponse()
+        response.isSingle = result.is_single
+        response.countSoFar = len(result.values)
+        response.simpleDType = _simple_dtype(result.values.dtype)
+        response.done = result.done
+        response.closed = False
+        response.hasDataloss = False
+        return response
+
+    def GetJobNamedResult(self, request, context):
+        self._count("GetJobNamedResult")
+        result = self._result(request, context)
+        start = request.longOffset.value if request.HasField("longOffset") else request.offset
+        stop = len(result.values) if request.limit == 0 else min(len(result.values), start + request.limit)
+        for offset in range(start, stop, self.chunk_size):
+            chunk = result.values[offset:min(stop, offset + self.chunk_size)]
+            response = job_results_pb2.GetJobNamedResultResponse()
+            response.countOfItems = len(chunk)
+            response.data = chunk.tobytes()
+            yield response
+
+
+class FakeFrontendService(frontend_pb2_grpc.FrontendServicer):
+    def __init__(self, chunk_size: int, version: str) -> None:
+        super().__init__()
+        self.chunk_size = chunk_size
+        self.version = version
+        self.simulated_samples: Dict[str, numpy.ndarray] = {}
+
+    def GetVersion(self, request, context):
+        return wrappers_pb2.StringValue(value=self.version)
+
+    def HealthCheck(self, request, context):
+        response = frontend_pb2.HealthCheckResponse()
+        response.ok = True
+        return response
+
+    def PullSimulatorSamples(self, request, context):
+        samples = self.simulated_samples.get(request.jobId)
+        if samples is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, f"no simulated samples for job {request.jobId}")
+        response = job_results_pb2.SimulatorSamplesResponse()
+        response.ok = True
+        response.header.simpleDType = _simple_dtype(samples.dtype)
+        response.header.countOfItems = len(samples)
+        yield response
+        for offset in range(0, len(samples), self.chunk_size):
+            response = job_results_pb2.SimulatorSamplesResponse()
+            response.ok = True
+            response.data.data = samples[offset:offset + self.chunk_size].tobytes()
+            yield response
+
+
+class FakeQmServer:
+    """
+    A local gRPC server with fake Frontend and JobResults services
+
+    :param chunk_size: The number of items sent in every streamed message
+    :param port: The port to listen on, 0 to pick a free one
+    """
+
+    def __init__(self, chunk_size: int = 10000, port: int = 0, version: str = "0.5.138",
+                 max_workers: int = 16) -> None:
+        super().__init__()
+        self.job_results = FakeJobResultsService(chunk_size)
+        self.frontend = FakeFrontendService(chunk_size, version)
+        self._server = grpc.server(ThreadPoolExecutor(max_workers=max_workers), options=[
+            ("grpc.max_send_message_length", MAX_MESSAGE_SIZE),
+            ("grpc.max_receive_message_length", MAX_MESSAGE_SIZE),
+        ])
+        job_results_pb2_grpc.add_JobResultsServiceServicer_to_server(self.job_results, self._server)
+        frontend_pb2_grpc.add_FrontendServicer_to_server(self.frontend, self._server)
+        self.port = self._server.add_insecure_port(f"localhost:{port}")
+        self.address = f"localhost:{self.port}"
+
+    def add_result(self, job_id: str, name: str, values: numpy.ndarray, is_single: bool = False,
+                   done: bool = True):
+        """Serve `values` as the named result `name` of job `job_id`"""
+        if values.dtype.names is None:
+            wrapped = numpy.empty(len(values), dtype=[("value", values.dtype)])
+            wrapped["value"] = values
+            values = wrapped
+        self.job_results.jobs.setdefault(job_id, {})[name] = _NamedResult(values, is_single, done)
+
+    def set_simulated_samples(self, job_id: str, samples: numpy.ndarray):
+        """Serve `samples` as the simulated samples of job `job_id`"""
+        self.frontend.simulated_samples[job_id] = samples
+
+    def start(self) -> "FakeQmServer":
+        self._server.start()
+        return self
+
+    def stop(self, grace: Optional[float] = None):
+        self._server.stop(grace)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
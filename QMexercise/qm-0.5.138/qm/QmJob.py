@@ -6,6 +6,7 @@ from qm._deprecated import deprecated
 from qm.pb.job_results_pb2 import PullSimulatorSamplesRequest
 from qm.persistence import BinaryAsset, FileBinaryAsset
 from qm._results import JobResults
+from qm._async_results import AsyncJobResults
 from qm.results.SimulatorSamples import SimulatorSamples
 
 from qm._logger import logger
@@ -13,8 +14,8 @@ from qm.pb.frontend_pb2 import IsJobRunningRequest, IsJobAcquiringDataRequest, I
 from qm.pb.frontend_pb2 import ResumeRequest, PausedStatusRequest
 from qm.pb.job_results_pb2_grpc import JobResultsServiceStub
 
+import tempfile
 from enum import Enum
-from io import BytesIO
 import numpy.lib.format as _format
 import json as _json
 from google.protobuf.json_format import MessageToDict
@@ -225,30 +226,29 @@ class QmJob:
         request.includeAnalog = include_analog
         request.includeDigital = include_digital
 
-        writer = BytesIO()
-        data_writer = BytesIO()
-
+        samples = None
+        buffer = None
+        position = 0
         for result in self._frontend.PullSimulatorSamples(request):
             if result.ok:
                 one_of = result.WhichOneof("body")
                 if one_of == "header":
-                    _format.write_array_header_2_0(writer, {
-                        "descr": _json.loads(result.header.simpleDType),
-                        "fortran_order": False,
-                        "shape": (result.header.countOfItems,)
-                    })
+                    samples = _allocate_samples(
+                        _format.descr_to_dtype(_json.loads(result.header.simpleDType)),
+                        result.header.countOfItems
+                    )
+                    buffer = memoryview(samples.view(numpy.uint8))
                 elif one_of == "data":
-                    data_writer.write(result.data.data)
+                    data = result.data.data
+                    buffer[position:position + len(data)] = data
+                    position += len(data)
 
             else:
                 raise RuntimeError("Error while pulling samples")
 
-        data_writer.seek(0)
-        for d in data_writer:
-            writer.write(d)
-
-        writer.seek(0)
-        return numpy.load(writer)
+        if samples is not None and position != samples.nbytes:
+            raise RuntimeError(f"Expected {samples.nbytes} bytes of simulated samples, got {position}")
+        return samples
 
     def get_simulated_samples(self, include_analog=True, include_digital=True):
         """
@@ -302,6 +302,18 @@ class QmJob:
             self.manager.store
         )
 
+    async def async_result_handles(self) -> AsyncJobResults:
+        """
+        The asyncio counterpart of :attr:`result_handles`, backed by a ``grpc.aio`` channel.
+        Must be awaited from within the event loop that will use the handles
+
+        :return: A :class:`qm._async_results.AsyncJobResults` holding the handles that this job generated
+        """
+        return await AsyncJobResults.load(
+            self._id,
+            JobResultsServiceStub(self.manager._async_channel())
+        )
+
     def is_paused(self):
         """
         :return: Returns ``True`` if the job is in a paused state.
@@ -357,6 +369,16 @@ class QmJob:
             return AcquiringStatus(2)
 
 
+_MAX_IN_MEMORY_SAMPLES_BYTES = 1024 * 1024 * 1024
+
+
+def _allocate_samples(d_type: numpy.dtype, count: int) -> numpy.ndarray:
+    if count * d_type.itemsize <= _MAX_IN_MEMORY_SAMPLES_BYTES:
+        return numpy.empty(count, dtype=d_type)
+    # very long simulations are backed by a temporary file, which is removed once the array is released
+    return numpy.memmap(tempfile.TemporaryFile(), dtype=d_type, mode="w+", shape=(count,))
+
+
 class _SavedResults:
 
     def __init__(self, asset: BinaryAsset) -> None:
@@ -1,4 +1,5 @@
 import json
+from contextlib import contextmanager
 
 import numpy
 
@@ -15,6 +16,7 @@ from qm.pb.qm_manager_pb2 import CloseQuantumMachineRequest
 from qm.program import _Program
 from qm._SimulationConfig import SimulationConfig, LoopbackInterface, QSimInterface
 import os
+import grpc
 from grpc._channel import _InactiveRpcError
 
 
@@ -28,6 +30,7 @@ class QuantumMachine(object):
         self._manager = manager
         self._frontend = manager._frontend
         self._logger = logger.getChild("job")
+        self._batch = None
 
     @property
     def manager(self) -> 'qm.QuantumMachinesManager.QuantumMachinesManager':
@@ -300,8 +303,7 @@ class QuantumMachine(object):
         request.setCorrection.correction.v01 = values[1]
         request.setCorrection.correction.v10 = values[2]
         request.setCorrection.correction.v11 = values[3]
-        response = self._frontend.PerformQmRequest(request)
-        self._handle_qm_api_response(response)
+        return self._perform_qm_request(request)
 
     def set_correction(self, qe, values):
         """
@@ -338,8 +340,7 @@ class QuantumMachine(object):
         request.setCorrection.correction.v01 = values[1]
         request.setCorrection.correction.v10 = values[2]
         request.setCorrection.correction.v11 = values[3]
-        response = self._frontend.PerformQmRequest(request)
-        self._handle_qm_api_response(response)
+        return self._perform_qm_request(request)
 
     def set_frequency(self, qe, freq):
         """
@@ -404,8 +405,7 @@ class QuantumMachine(object):
         request = self._init_qm_request()
         request.setFrequency.qe = element
         request.setFrequency.value = freq
-        response = self._frontend.PerformQmRequest(request)
-        self._handle_qm_api_response(response)
+        return self._perform_qm_request(request)
 
     def get_dc_offset_by_qe(self, qe, input):
         """
@@ -519,8 +519,7 @@ class QuantumMachine(object):
         request.setOutputDcOffset.qe.port = input
         request.setOutputDcOffset.I = offset
         request.setOutputDcOffset.Q = offset
-        response = self._frontend.PerformQmRequest(request)
-        return self._handle_qm_api_response(response)
+        return self._perform_qm_request(request)
 
     def set_input_dc_offset_by_element(self, element, output, offset):
         """
@@ -552,8 +551,7 @@ class QuantumMachine(object):
         request.setInputDcOffset.qe.qe = element
         request.setInputDcOffset.qe.port = output
         request.setInputDcOffset.offset = offset
-        response = self._frontend.PerformQmRequest(request)
-        return self._handle_qm_api_response(response)
+        return self._perform_qm_request(request)
 
     def get_input_dc_offset_by_element(self, element, output):
         """
@@ -638,8 +636,7 @@ class QuantumMachine(object):
         request.setDigitalRoute.delay.port = digital_input
         request.setDigitalRoute.value = delay
 
-        response = self._frontend.PerformQmRequest(request)
-        return self._handle_qm_api_response(response)
+        return self._perform_qm_request(request)
 
     def get_digital_buffer(self, element, digital_input):
         """
@@ -690,8 +687,7 @@ class QuantumMachine(object):
         request.setDigitalRoute.buffer.port = digital_input
         request.setDigitalRoute.value = buffer
 
-        response = self._frontend.PerformQmRequest(request)
-        return self._handle_qm_api_response(response)
+        return self._perform_qm_request(request)
 
     def get_time_of_flight(self, element):
         """
@@ -818,10 +814,56 @@ class QuantumMachine(object):
         else:
             raise Exception("Invalid value_2 type (The possible types are: int, bool or float)")
 
+        return self._perform_qm_request(request)
+
+    @contextmanager
+    def batch_updates(self):
+        """
+        Send the runtime updates made in the block, such as DC offsets, mixer corrections, intermediate
+        frequencies and IO values, without waiting for each of them to complete.
+        The updates are pipelined over the channel and all of them are waited for when the block exits,
+        so a group of updates costs about one round-trip::
+
+            with qm.batch_updates():
+                qm.set_output_dc_offset_by_element("qubit", "I", 0.01)
+                qm.set_output_dc_offset_by_element("qubit", "Q", -0.02)
+
+        All the updates of the block are sent with the config of the qm as it was when the block started,
+        and may be applied in any order, so a setting should be updated at most once in a block.
+
+        :raises RuntimeError: if any of the updates failed, with the messages of all the failures
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+        self._batch = _QmRequestBatch(self._frontend)
+        try:
+            yield self._batch
+        except BaseException:
+            self._batch.wait(raise_errors=False)
+            raise
+        else:
+            self._batch.wait()
+        finally:
+            self._batch = None
+
+    def _perform_qm_request(self, request):
+        if self._batch is not None:
+            self._batch.send(request)
+            return
         response = self._frontend.PerformQmRequest(request)
         return self._handle_qm_api_response(response)
 
     def _init_qm_request(self):
+        if self._batch is not None:
+            if self._batch.template is None:
+                self._batch.template = self._new_qm_request()
+            request = HighQmApiRequest()
+            request.CopyFrom(self._batch.template)
+            return request
+        return self._new_qm_request()
+
+    def _new_qm_request(self):
         request = HighQmApiRequest()
         self.get_config()
         request.config.root.CopyFrom(python_to_pb(self._config).struct_value)
@@ -921,3 +963,40 @@ class QuantumMachine(object):
         json_str = json.dumps(self.get_config())
         with open(filename, 'w') as writer:
             writer.write(json_str)
+
+
+class _QmRequestBatch(object):
+    """The runtime update requests sent in a ``batch_updates()`` block"""
+
+    def __init__(self, frontend):
+        super(_QmRequestBatch, self).__init__()
+        self._frontend = frontend
+        self._futures = []
+        self.template = None
+
+    def send(self, request):
+        self._futures.append(self._frontend.PerformQmRequest.future(request))
+
+    def wait(self, raise_errors=True):
+        """
+        Wait for all the sent requests
+
+        :param raise_errors: Raise the errors of all the failed requests together, otherwise only log them
+        """
+        futures, self._futures = self._futures, []
+        errors = []
+        for future in futures:
+            try:
+                response = future.result()
+            except grpc.RpcError as e:
+                errors.append(e.details() if hasattr(e, "details") else str(e))
+                continue
+            if not response.ok:
+                errors.extend([it.message for it in response.errors])
+
+        if errors:
+            logger.error("Failed %d of %d updates: %s", len(errors), len(futures), "\n\t" + "\n\t".join(errors))
+            if raise_errors:
+                exception = RuntimeError("\n".join(errors))
+                exception.errors = errors
+                raise exception
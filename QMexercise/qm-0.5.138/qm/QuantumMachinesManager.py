@@ -1,4 +1,7 @@
+import asyncio
 import json
+import weakref
+
 import grpc
 
 from qm.QmJob import QmJob
@@ -8,7 +11,7 @@ from qm import _Program
 from qm._logger import logger
 
 from qm.QuantumMachine import QuantumMachine
-from qm.pb import frontend_pb2_grpc
+from qm._channel_pool import ChannelSettings, channel_pool
 from google.protobuf import empty_pb2
 
 from qm.pb.frontend_pb2 import ResetDataProcessingRequest, SimulationRequest
@@ -26,6 +29,7 @@ class QuantumMachinesManager(object):
         """
         :param string host: Host where to find the QM orchestrator. If ``None``, local settings are used
         :param port: Port where to find the QM orchestrator. If None, local settings are used
+        :key channel_settings: ``ChannelSettings`` of the connection, managers with equal settings share a channel
         """
         super(QuantumMachinesManager, self).__init__()
 
@@ -42,14 +46,15 @@ class QuantumMachinesManager(object):
         self._store = store
 
         self._log = logger
-        max_message_size = 1024 * 1024 * 100  # 100 mb in bytes
-        self._channel = channel = grpc.insecure_channel(host + ":" + str(port),
-                                                        options=[
-                                                            ("grpc.max_receive_message_length", max_message_size),
-                                                        ],
-                                                        compression=grpc.Compression.Gzip
-                                                        )
-        self._frontend = frontend_pb2_grpc.FrontendStub(channel)
+        settings = kargs.get("channel_settings")
+        if not isinstance(settings, ChannelSettings):
+            settings = ChannelSettings()
+        self._channel_settings = settings
+        self._address = host + ":" + str(port)
+        self._pooled_channel = channel_pool.acquire(self._address, settings)
+        self._channel = self._pooled_channel.channel
+        self._aio_channels = weakref.WeakKeyDictionary()
+        self._frontend = self._pooled_channel.frontend
         raise_on_error = config.strict_healthcheck is not False
         if "log_level" in kargs:
             new_level = kargs.get("log_level")
@@ -57,9 +62,16 @@ class QuantumMachinesManager(object):
                 logger.setLevel(new_level)
             except ValueError:
                 logger.warning("Failed to set log level. level '%s' is not recognized", new_level)
-        self.perform_healthcheck(raise_on_error)
 
-        self.validate_version(host)
+        # a channel shared with another manager was already checked when that manager connected
+        if not self._pooled_channel.verified:
+            try:
+                healthy = self.perform_healthcheck(raise_on_error)
+                self.validate_version(host)
+            except BaseException:
+                self._close()
+                raise
+            self._pooled_channel.verified = healthy
 
     def __enter__(self):
         return self
@@ -77,6 +89,7 @@ class QuantumMachinesManager(object):
         Perform a health check against the QM server.
 
         :param strict: Will raise an exception if health check failed
+        :return: Whether the health check passed
         """
         with _grpc_context():
             self._log.info("Performing health check")
@@ -90,6 +103,7 @@ class QuantumMachinesManager(object):
                     self._log.error("  HC Error: " + msg)
                 if strict:
                     raise Exception("Health check failed")
+            return res.ok
 
     def version(self):
         """
@@ -117,7 +131,37 @@ class QuantumMachinesManager(object):
         self._close()
 
     def _close(self):
-        self._channel.close()
+        if self._pooled_channel is not None:
+            channel_pool.release(self._pooled_channel)
+            self._pooled_channel = None
+
+    async def close_async(self):
+        """
+        Closes the connection, including the asyncio channel the async result handles use in the running loop
+        """
+        channel = self._aio_channels.pop(asyncio.get_running_loop(), None)
+        if channel is not None:
+            await channel.close()
+        self._close()
+
+    def _async_channel(self):
+        # grpc.aio channels are bound to the event loop they are created in, so there is one per running loop.
+        # the channels of loops that were closed, like the ones of earlier asyncio.run calls, are dropped
+        loop = asyncio.get_running_loop()
+        channel = self._aio_channels.get(loop)
+        if channel is None:
+            try:
+                from grpc import aio
+            except ImportError:
+                raise Exception("async result handles require grpcio>=1.32 with grpc.aio support")
+            for closed in [other for other in self._aio_channels if other.is_closed()]:
+                del self._aio_channels[closed]
+            channel = aio.insecure_channel(self._address,
+                                           options=self._channel_settings.options(),
+                                           compression=self._channel_settings.data_compression
+                                           )
+            self._aio_channels[loop] = channel
+        return channel
 
     def open_qm(self, config, close_other_machines=False):
         """
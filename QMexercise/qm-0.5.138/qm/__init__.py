@@ -1,5 +1,41 @@
-from qm.QuantumMachine import QuantumMachine
-from qm.program import _Program
-from qm.program import _ResultAnalysis
+import importlib as _importlib
+import sys as _sys
+import types as _types
+
 from qm._SimulationConfig import *
-from qm.program._qua_config_schema import validate_config
+
+# attributes of the package that load their module on first access, so importing qm does not load the protobuf
+# modules, grpc and the config schema until they are used
+_lazy_attributes = {
+    "QuantumMachine": "qm.QuantumMachine",
+    "_Program": "qm.program",
+    "_ResultAnalysis": "qm.program",
+    "validate_config": "qm.program._qua_config_schema",
+    "ChannelSettings": "qm._channel_pool",
+    "LocalSimulator": "qm._local_simulator",
+    "StreamProcessor": "qm.results.StreamProcessor",
+}
+
+
+def __getattr__(name):
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()).union(_lazy_attributes))
+
+
+class _Package(_types.ModuleType):
+    def __setattr__(self, name, value):
+        # importing the qm.QuantumMachine submodule binds it on the package, where the class of that name belongs
+        if name in _lazy_attributes and isinstance(value, _types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+_sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,251 @@
+import asyncio
+from typing import Optional, Union, Dict, Tuple, Generator, AsyncGenerator
+import numpy
+import numpy.lib.format as _format
+from qm._logger import logger
+from qm.pb.job_results_pb2_grpc import JobResultsServiceStub
+from qm.pb.job_results_pb2 import GetJobResultSchemaRequest
+from qm._results import (
+    POLL_JITTER,
+    POLL_MAX_INTERVAL,
+    POLL_MIN_INTERVAL,
+    JobResultItemSchema,
+    JobResultSchema,
+    NamedJobResultHeader,
+    _Backoff,
+    _Batcher,
+    _ArrayFiller,
+    _all_finished,
+    _fetch_output,
+    _fetch_range,
+    _named_header_request,
+    _named_result_request,
+    _single_value,
+    _to_named_header,
+    _to_schema,
+)
+
+
+class AsyncNamedJobResult:
+    """
+    The asyncio counterpart of :class:`qm._results.BaseNamedJobResult`
+
+    The service must be a stub on a ``grpc.aio`` channel, see :func:`qm.QmJob.QmJob.async_result_handles`
+    """
+
+    def __init__(self, job_id: str, schema: JobResultItemSchema, service: JobResultsServiceStub) -> None:
+        super().__init__()
+        self._job_id = job_id
+        self._schema = schema
+        self._service = service
+        self._dtype = _format.descr_to_dtype(schema.dtype)
+
+    @property
+    def name(self) -> str:
+        """The name of result this handle is connected to"""
+        return self._schema.name
+
+    @property
+    def job_id(self) -> str:
+        """The job id this result came from"""
+        return self._job_id
+
+    @property
+    def is_single(self) -> bool:
+        return self._schema.is_single
+
+    @property
+    def expected_count(self) -> int:
+        return self._schema.expected_count
+
+    @property
+    def numpy_dtype(self):
+        return self._schema.dtype
+
+    async def get_header(self) -> NamedJobResultHeader:
+        request = _named_header_request(self._job_id, self.name)
+        response = await self._service.GetJobNamedResultHeader(request)
+        return _to_named_header(response, self._job_id, self.name)
+
+    async def count_so_far(self) -> int:
+        """
+        :return: The number of values this result has so far
+        """
+        return (await self.get_header()).count_so_far
+
+    async def has_dataloss(self) -> bool:
+        """
+        :return: if there was data loss during job execution
+        """
+        return (await self.get_header()).has_dataloss
+
+    async def is_processing(self) -> bool:
+        header = await self.get_header()
+        return not (header.done or header.closed)
+
+    async def fetch(self, item: Union[int, slice], out: Optional[numpy.ndarray] = None) -> numpy.array:
+        """
+        Fetch the current value of the result from the server into local memory
+
+        :param item: The index or slice of values to fetch
+        :param out: An optional one dimensional array of the result dtype to fetch into
+        :return: The fetched values, a view into `out` if it was given
+        """
+        header = await self.get_header()
+        (start, capacity) = _fetch_range(item, header.count_so_far)
+        out = _fetch_output(self._dtype, capacity, out)
+        filler = _ArrayFiller(out, capacity, self.name)
+        if capacity > 0:
+            request = _named_result_request(self._job_id, self.name, start, capacity)
+            async for result in self._service.GetJobNamedResult(request):
+                filler.add(result)
+
+        if header.has_dataloss:
+            logger.warning(f"Results variable {self.name} has data loss")
+
+        return out[:filler.count]
+
+    async def fetch_all(self):
+        """
+        Fetch all the values of the result so far
+
+        :return: The values, or the single value saved if this is a result of a ``save`` terminal
+        """
+        if self.is_single:
+            return _single_value(await self.fetch(0))
+        return await self.fetch(slice(0, None))
+
+    async def stream(self, batch_size: Optional[int] = None) -> AsyncGenerator[numpy.ndarray, None]:
+        """
+        Stream the values of the result as numpy arrays, see \
+        :func:`MultipleNamedJobResult.batch_fetcher<qm._results.MultipleNamedJobResult.batch_fetcher>`
+
+        Usage::
+
+            async for chunk in handle.stream():
+                process(chunk)
+
+        :param batch_size: When given, the chunks are regrouped into arrays of exactly `batch_size` items
+        """
+        batcher = _Batcher(batch_size, self._dtype)
+        await self.wait_for_values(1, timeout=0.5)
+        request = _named_result_request(self._job_id, self.name, 0, 0)
+        async for result in self._service.GetJobNamedResult(request):
+            for batch in batcher.add(result):
+                yield batch
+        for batch in batcher.flush():
+            yield batch
+
+    async def wait_for_values(self, count: int = 1, timeout: Optional[float] = None):
+        """Wait until we know at least `count` values were processed for this named result
+
+        :param count: The number of items to wait for
+        :param timeout: Timeout for waiting in seconds
+        """
+        await _wait([self], lambda headers: headers[self.name].count_so_far >= count, timeout)
+
+    async def wait_for_all_values(self, timeout: Optional[float] = None) -> bool:
+        """Wait until we know all values were processed for this named result
+
+        :param timeout: Timeout for waiting in seconds
+        :return: True if job finished successfully and False if job has closed before done
+        """
+        headers = await _wait([self], _all_finished, timeout)
+        if headers is None:
+            raise TimeoutError(f"result {self.name} was not done in time")
+        return headers[self.name].done
+
+
+class AsyncJobResults:
+    """
+    The asyncio counterpart of :class:`qm._results.JobResults`
+
+    This object is created by awaiting :func:`QmJob.async_result_handles<qm.QmJob.QmJob.async_result_handles>`.
+    The results of many jobs can be downloaded concurrently from one event loop::
+
+        results = await job.async_result_handles()
+        await results.wait_for_all_values()
+        values = await results.fetch_all()
+
+    """
+
+    def __init__(self, job_id: str, service: JobResultsServiceStub, schema: JobResultSchema) -> None:
+        super().__init__()
+        self._job_id = job_id
+        self._service = service
+        self._schema = schema
+        self._all_results: Dict[str, AsyncNamedJobResult] = {
+            name: AsyncNamedJobResult(job_id, item_schema, service) for (name, item_schema) in schema.items.items()
+        }
+
+    @staticmethod
+    async def load(job_id: str, service: JobResultsServiceStub) -> "AsyncJobResults":
+        request = GetJobResultSchemaRequest()
+        request.jobId = job_id
+        response = await service.GetJobResultSchema(request)
+        return AsyncJobResults(job_id, service, _to_schema(response))
+
+    def __iter__(self) -> Generator[Tuple[str, AsyncNamedJobResult], None, None]:
+        for item in self._schema.items.values():
+            yield item.name, self.get(item.name)
+
+    def __contains__(self, name: str):
+        return name in self._all_results
+
+    def get(self, name: str) -> Optional[AsyncNamedJobResult]:
+        """Get a handle to a named result
+
+        :return: A handle object to the results or None if the named results in unknown
+        """
+        return self._all_results[name] if name in self._all_results else None
+
+    async def get_headers(self) -> Dict[str, NamedJobResultHeader]:
+        """Read the headers of all the named results concurrently
+
+        :return: The headers by result name
+        """
+        return await _get_headers(list(self._all_results.values()))
+
+    async def is_processing(self) -> bool:
+        """Check if the job is still processing results
+
+        :return: True if results are still being processed, False otherwise
+        """
+        return not _all_finished(await self.get_headers())
+
+    async def fetch_all(self) -> Dict[str, numpy.array]:
+        """Fetch all the named results concurrently
+
+        :return: The values by result name
+        """
+        names = list(self._all_results.keys())
+        values = await asyncio.gather(*[self._all_results[name].fetch_all() for name in names])
+        return dict(zip(names, values))
+
+    async def wait_for_all_values(self, timeout: Optional[float] = None) -> bool:
+        """Wait until we know all values were processed for all named results
+
+        :param timeout: Timeout for waiting in seconds
+        :return: True if all finished successfully, False if any result was closed before done
+        """
+        headers = await _wait(list(self._all_results.values()), _all_finished, timeout)
+        if headers is None:
+            raise TimeoutError("results were not done in time")
+        return all(header.done for header in headers.values())
+
+
+async def _get_headers(results) -> Dict[str, NamedJobResultHeader]:
+    headers = await asyncio.gather(*[result.get_header() for result in results])
+    return {result.name: header for (result, header) in zip(results, headers)}
+
+
+async def _wait(results, condition, timeout: Optional[float]) -> Optional[Dict[str, NamedJobResultHeader]]:
+    backoff = _Backoff(timeout, POLL_MIN_INTERVAL, POLL_MAX_INTERVAL, POLL_JITTER)
+    while True:
+        headers = await _get_headers(results)
+        if condition(headers):
+            return headers
+        delay = backoff.next_delay(headers)
+        if delay is None:
+            return None
+        await asyncio.sleep(delay)
@@ -0,0 +1,132 @@
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import grpc
+
+from qm.pb import frontend_pb2_grpc
+
+# the frontend calls that carry a config or a program, the only large messages the client sends
+_CONFIG_CALLS = frozenset(["OpenQuantumMachine", "Simulate", "Execute", "PerformQmRequest", "ValidateConfig"])
+
+
+@dataclass(frozen=True)
+class ChannelSettings:
+    """
+    The settings of the gRPC channel to the QM server. Managers with equal settings to the same address share a channel
+
+    :param max_message_size: The largest message sent or received, in bytes
+    :param config_compression: The compression of the calls that send a config or a program
+    :param data_compression: The compression of every other call, including the ones fetching results
+    :param keepalive_time_ms: The interval of keepalive pings on an idle connection, None for the gRPC default
+    :param keepalive_timeout_ms: How long to wait for a keepalive ping to be acknowledged, None for the gRPC default
+    """
+    max_message_size: int = 1024 * 1024 * 100
+    config_compression: grpc.Compression = grpc.Compression.Gzip
+    data_compression: grpc.Compression = grpc.Compression.NoCompression
+    keepalive_time_ms: Optional[int] = None
+    keepalive_timeout_ms: Optional[int] = None
+
+    def options(self):
+        options = [
+            ("grpc.max_receive_message_length", self.max_message_size),
+            ("grpc.max_send_message_length", self.max_message_size),
+        ]
+        if self.keepalive_time_ms is not None:
+            options.append(("grpc.keepalive_time_ms", self.keepalive_time_ms))
+            options.append(("grpc.keepalive_permit_without_calls", 1))
+        if self.keepalive_timeout_ms is not None:
+            options.append(("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms))
+        return options
+
+
+class _CompressedCall:
+    def __init__(self, multi_callable, compression: grpc.Compression) -> None:
+        super().__init__()
+        self._multi_callable = multi_callable
+        self._compression = compression
+
+    def __call__(self, request, **kwargs):
+        kwargs.setdefault("compression", self._compression)
+        return self._multi_callable(request, **kwargs)
+
+    def future(self, request, **kwargs):
+        kwargs.setdefault("compression", self._compression)
+        return self._multi_callable.future(request, **kwargs)
+
+    def with_call(self, request, **kwargs):
+        kwargs.setdefault("compression", self._compression)
+        return self._multi_callable.with_call(request, **kwargs)
+
+
+class FrontendCalls:
+    """
+    A frontend stub that compresses every call according to its kind, see ``ChannelSettings``
+    """
+
+    def __init__(self, channel: grpc.Channel, settings: ChannelSettings) -> None:
+        super().__init__()
+        self._stub = frontend_pb2_grpc.FrontendStub(channel)
+        self._settings = settings
+
+    def __getattr__(self, name):
+        multi_callable = getattr(self._stub, name)
+        if name in _CONFIG_CALLS:
+            compression = self._settings.config_compression
+        else:
+            compression = self._settings.data_compression
+        call = _CompressedCall(multi_callable, compression)
+        # later lookups of the same call skip __getattr__
+        setattr(self, name, call)
+        return call
+
+
+class PooledChannel:
+    """A channel shared by the managers connected to the same server with the same settings"""
+
+    def __init__(self, key, channel: grpc.Channel, settings: ChannelSettings) -> None:
+        super().__init__()
+        self.key = key
+        self.channel = channel
+        self.frontend = FrontendCalls(channel, settings)
+        self.verified = False
+        self._users = 0
+
+
+class ChannelPool:
+    """
+    The process-wide channels to QM servers, keyed by address and settings
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._channels: Dict[Tuple[str, ChannelSettings], PooledChannel] = {}
+
+    def acquire(self, address: str, settings: ChannelSettings) -> PooledChannel:
+        """
+        :return: The pooled channel to `address`, created if there is none. Release it with ``release``
+        """
+        key = (address, settings)
+        with self._lock:
+            pooled = self._channels.get(key)
+            if pooled is None:
+                channel = grpc.insecure_channel(address, options=settings.options(),
+                                                compression=settings.data_compression)
+                pooled = PooledChannel(key, channel, settings)
+                self._channels[key] = pooled
+            pooled._users += 1
+            return pooled
+
+    def release(self, pooled: PooledChannel):
+        """Close the channel once it is released by all the managers that acquired it"""
+        with self._lock:
+            pooled._users -= 1
+            if pooled._users > 0:
+                return
+            if self._channels.get(pooled.key) is pooled:
+                del self._channels[pooled.key]
+        pooled.channel.close()
+
+
+channel_pool = ChannelPool()
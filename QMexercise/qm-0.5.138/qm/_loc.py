@@ -1,9 +1,47 @@
-import traceback
+import linecache
 import os
-from pathlib import Path
+import sys
+
+_qm_package_dir = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+# both keyed by code object, so unrolled loops calling the same line pay for the lookup only once
+_is_package_code = {}
+_formatted_locs = {}
+
+_capture_enabled = os.environ.get("QM_CAPTURE_LOC", "1") != "0"
+
+
+def set_loc_capture(enabled: bool):
+    """
+    Enable or disable recording the source location of every QUA statement and expression.
+    Disabling it speeds up building large programs, at the cost of less informative compilation errors.
+    It can also be disabled by setting the environment variable ``QM_CAPTURE_LOC=0``
+    """
+    global _capture_enabled
+    _capture_enabled = enabled
+
+
+def _in_package(code) -> bool:
+    result = _is_package_code.get(code)
+    if result is None:
+        result = os.path.abspath(code.co_filename).startswith(_qm_package_dir)
+        _is_package_code[code] = result
+    return result
 
 
 def _get_loc():
-    qm_package_dir = Path(os.path.abspath(__file__)).parent
-    trace = [i for i in traceback.extract_stack() if qm_package_dir not in Path(i.filename).parents][-1]
-    return 'File "{}", line {}: {} '.format(trace.filename, trace.lineno, trace.line)
+    if not _capture_enabled:
+        return ""
+    frame = sys._getframe(1)
+    while frame is not None and _in_package(frame.f_code):
+        frame = frame.f_back
+    if frame is None:
+        return ""
+    key = (frame.f_code, frame.f_lineno)
+    loc = _formatted_locs.get(key)
+    if loc is None:
+        filename = frame.f_code.co_filename
+        line = linecache.getline(filename, frame.f_lineno, frame.f_globals).strip()
+        loc = 'File "{}", line {}: {} '.format(filename, frame.f_lineno, line)
+        _formatted_locs[key] = loc
+    return loc
@@ -0,0 +1,451 @@
+"""
+An offline simulator of the deterministic subset of QUA, rendering the output samples of a program with numpy::
+
+    job = LocalSimulator().simulate(config, prog, SimulationConfig(duration=2000))
+    job.get_simulated_samples().con1.plot()
+
+It interprets the statements of the program in order, keeping a timeline, an oscillator frequency and a frame for
+every element. It supports ``play`` (with ``amp``, ``duration``, ``condition`` and ``ramp``), ``measure``, ``wait``,
+``align``, ``frame_rotation``, ``reset_frame``, ``update_frequency``, ``update_correction``, ``assign``, ``for_``,
+``for_each_``, ``if_`` and ``strict_timing_``, with the pulses, waveforms, intermediate frequencies, digital markers
+and mixer corrections of the config. Measurements are integrated over the samples looped back to the inputs.
+
+Being an interpreter and not a compiler, it does not model the latencies of the real-time processing, so the
+timing of a program is the ideal one. The loopback latency is modeled, its noise and the virtual connections between
+elements are not. Results of measurements are in units of the output samples, without the fixed point scaling of the
+OPX.
+"""
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from qm._SimulationConfig import SimulationConfig, LoopbackInterface
+from qm.pb.inc_qua_config_pb2 import QuaConfig
+from qm.pb.inc_qua_pb2 import QuaProgram as _Q
+from qm.program import _Program
+from qm.results.SimulatorSamples import SimulatorSamples
+
+# a loop that never reaches the end of the simulation, like a while_ that does not play, is stopped here
+_MAX_STATEMENTS = 10000000
+
+_BINARY_OPERATIONS = {
+    _Q.BinaryExpression.ADD: lambda a, b: a + b,
+    _Q.BinaryExpression.SUB: lambda a, b: a - b,
+    _Q.BinaryExpression.MULT: lambda a, b: a * b,
+    _Q.BinaryExpression.DIV: lambda a, b: int(a / b) if type(a) is int and type(b) is int else a / b,
+    _Q.BinaryExpression.AND: lambda a, b: a & b,
+    _Q.BinaryExpression.OR: lambda a, b: a | b,
+    _Q.BinaryExpression.XOR: lambda a, b: a ^ b,
+    _Q.BinaryExpression.LT: lambda a, b: a < b,
+    _Q.BinaryExpression.LET: lambda a, b: a <= b,
+    _Q.BinaryExpression.GT: lambda a, b: a > b,
+    _Q.BinaryExpression.GET: lambda a, b: a >= b,
+    _Q.BinaryExpression.EQ: lambda a, b: a == b,
+    _Q.BinaryExpression.SHL: lambda a, b: a << b,
+    _Q.BinaryExpression.SHR: lambda a, b: a >> b,
+}
+
+_CASTS = {_Q.INT: int, _Q.REAL: float, _Q.BOOL: bool}
+
+
+class LocalSimulator(object):
+    """
+    Simulates programs on this computer, without a QM server. See the module documentation for what is supported
+    """
+
+    def simulate(self, config, program, simulate):
+        """
+        :param config: A QM config
+        :param program: A QUA ``program()`` object
+        :param simulate: A ``SimulationConfig``, its duration is in clock cycles of 4ns. A ``LoopbackInterface``
+            connects analog outputs to the inputs read by ``measure``
+        :return: A ``LocalSimulationJob``
+        """
+        if type(program) is not _Program:
+            raise Exception("program argument must be of type qm.program.Program")
+        if type(simulate) is not SimulationConfig:
+            raise Exception("simulate argument must be of type SimulationConfig")
+        machine = _Machine(config, simulate)
+        machine.run(program.build(QuaConfig()))
+        return LocalSimulationJob(machine.samples(), machine.variables())
+
+
+class LocalSimulationJob(object):
+    def __init__(self, samples: np.ndarray, variables: Dict[str, list]):
+        super(LocalSimulationJob, self).__init__()
+        self._samples = samples
+        self._variables = variables
+
+    def get_simulated_samples(self) -> SimulatorSamples:
+        """
+        :return: The samples of every output port, in the layout of ``QmJob.get_simulated_samples``
+        """
+        return SimulatorSamples.from_np_array(self._samples)
+
+    @property
+    def variables(self) -> Dict[str, list]:
+        """The values of the QUA variables at the end of the simulation, by their name in the program"""
+        return self._variables
+
+
+class _Element(object):
+    def __init__(self, name: str, config: dict, mixers: dict):
+        super(_Element, self).__init__()
+        self.name = name
+        self.config = config
+        self.time = 0
+        self.phase = 0.0
+        self.frequency = config.get("intermediate_frequency", 0)
+        if "singleInput" in config:
+            self.ports = [tuple(config["singleInput"]["port"])]
+        elif "mixInputs" in config:
+            self.ports = [tuple(config["mixInputs"]["I"]), tuple(config["mixInputs"]["Q"])]
+        else:
+            self.ports = []
+        self.correction = self._find_correction(mixers)
+
+    def _find_correction(self, mixers: dict):
+        if len(self.ports) != 2:
+            return None
+        inputs = self.config["mixInputs"]
+        for entry in mixers.get(inputs.get("mixer"), []):
+            if entry.get("intermediate_frequency") == self.frequency and \
+                    entry.get("lo_frequency") == inputs.get("lo_frequency"):
+                return tuple(entry["correction"])
+        return 1.0, 0.0, 0.0, 1.0
+
+
+class _Machine(object):
+    def __init__(self, config: dict, simulate: SimulationConfig):
+        super(_Machine, self).__init__()
+        self._config = config
+        self._end = 4 * simulate.duration
+        self._elements = {name: _Element(name, element, config.get("mixers", {}))
+                          for (name, element) in config.get("elements", {}).items()}
+        self._analog = {}
+        self._digital = {}
+        for (controller, controller_config) in config.get("controllers", {}).items():
+            for port in controller_config.get("analog_outputs", {}):
+                self._analog[(controller, port)] = np.zeros(self._end)
+            for port in controller_config.get("digital_outputs", {}):
+                self._digital[(controller, port)] = np.zeros(self._end, dtype=bool)
+        self._loopback = {}
+        self._latency = 0
+        interface = simulate.simulation_interface
+        if type(interface) is LoopbackInterface:
+            if interface.noisePower != 0:
+                raise NotImplementedError("the local simulator does not support loopback noise")
+            # the samples of an output reach the input they are looped back to after latency ns
+            self._latency = interface.latency
+            for connection in interface.connections:
+                # LoopbackInterface stores the (fromQE, toQE, toQEInput) connections as (fromQE, -1, toQE, toQEInput)
+                if connection[1] == -1:
+                    raise NotImplementedError("the local simulator does not support loopback connections between "
+                                              "elements, connect controller ports")
+                self._loopback[(connection[2], connection[3])] = (connection[0], connection[1])
+        self._waveforms = {}
+        self._values = {}
+        self._statements = 0
+
+    def run(self, program: _Q):
+        for declaration in program.script.variables:
+            cast = _CASTS[declaration.type]
+            values = [self._literal(literal) for literal in declaration.value]
+            values += [cast(0)] * (declaration.size - len(values))
+            self._values[declaration.name] = [cast(value) for value in values]
+        self._run(program.script.body)
+
+    def variables(self) -> Dict[str, list]:
+        return {name: list(values) for (name, values) in self._values.items()}
+
+    def samples(self) -> np.ndarray:
+        columns = [(f"{controller}:analog:{port}", "<f8") for (controller, port) in self._analog]
+        columns += [(f"{controller}:digital:{port}", "?") for (controller, port) in self._digital]
+        samples = np.empty(self._end, dtype=columns)
+        controllers = self._config.get("controllers", {})
+        for ((controller, port), values) in self._analog.items():
+            offset = controllers[controller]["analog_outputs"][port].get("offset", 0.0)
+            samples[f"{controller}:analog:{port}"] = values + offset
+        for ((controller, port), values) in self._digital.items():
+            samples[f"{controller}:digital:{port}"] = values
+        return samples
+
+    # statements
+
+    def _run(self, body) -> None:
+        for statement in body.statements:
+            self._statements += 1
+            if self._statements > _MAX_STATEMENTS:
+                raise Exception(f"simulation stopped after {_MAX_STATEMENTS} statements, is there an endless loop?")
+            kind = statement.WhichOneof("statement_oneof")
+            handler = getattr(self, "_" + kind, None)
+            if handler is None:
+                raise Exception(f"the local simulator does not support {kind} statements")
+            handler(getattr(statement, kind))
+
+    def _loop(self, condition, body, update=None) -> None:
+        while condition():
+            before = {name: element.time for (name, element) in self._elements.items()}
+            self._run(body)
+            if update is not None:
+                self._run(update)
+            played = [element for element in self._elements.values() if element.time != before[element.name]]
+            # nothing the loop plays from now on is inside the simulated duration
+            if played and all(element.time >= self._end for element in played):
+                return
+
+    def _for(self, statement) -> None:
+        self._run(statement.init)
+        if statement.HasField("condition"):
+            condition = lambda: self._eval(statement.condition)
+        else:
+            condition = lambda: True
+        self._loop(condition, statement.body, statement.update)
+
+    def _forEach(self, statement) -> None:
+        arrays = [(iterator.variable, self._values[iterator.array.name]) for iterator in statement.iterator]
+        length = min(len(values) for (_, values) in arrays)
+        index = [0]
+
+        def next_values():
+            if index[0] >= length:
+                return False
+            for (variable, values) in arrays:
+                self._set(variable.name, 0, values[index[0]])
+            index[0] += 1
+            return True
+
+        self._loop(next_values, statement.body)
+
+    def _if(self, statement) -> None:
+        if self._eval(statement.condition):
+            self._run(statement.body)
+        elif statement.HasField("else"):
+            self._run(getattr(statement, "else"))
+
+    def _strictTiming(self, statement) -> None:
+        self._run(statement.body)
+
+    def _assign(self, statement) -> None:
+        value = self._eval(statement.expression)
+        target = statement.target
+        if target.WhichOneof("target") == "arrayCell":
+            self._set(target.arrayCell.arrayVar.name, self._eval(target.arrayCell.index), value)
+        else:
+            self._set(target.variable.name, 0, value)
+
+    def _save(self, statement) -> None:
+        pass
+
+    def _wait(self, statement) -> None:
+        duration = 4 * self._eval(statement.time)
+        for element in statement.qe:
+            self._element(element.name).time += duration
+
+    def _align(self, statement) -> None:
+        elements = [self._element(element.name) for element in statement.qe] or list(self._elements.values())
+        time = max(element.time for element in elements)
+        for element in elements:
+            element.time = time
+
+    def _zRotation(self, statement) -> None:
+        angle = self._eval(statement.value)
+        for element in statement.qe:
+            self._element(element.name).phase += angle
+
+    def _resetFrame(self, statement) -> None:
+        for element in statement.qe:
+            self._element(element.name).phase = 0.0
+
+    def _updateFrequency(self, statement) -> None:
+        self._element(statement.qe.name).frequency = self._eval(statement.value)
+
+    def _updateCorrection(self, statement) -> None:
+        correction = statement.correction
+        self._element(statement.qe.name).correction = tuple(
+            self._eval(value) for value in (correction.c0, correction.c1, correction.c2, correction.c3))
+
+    def _play(self, statement) -> None:
+        element = self._element(statement.qe.name)
+        duration = 4 * self._eval(statement.duration) if statement.HasField("duration") else None
+        if statement.WhichOneof("pulseType") == "rampPulse":
+            if duration is None:
+                raise Exception("a ramp must be played with a duration")
+            rate = self._eval(statement.rampPulse.value)
+            waveforms = [rate * np.arange(duration)] + [np.zeros(duration)] * (len(element.ports) - 1)
+            pulse = {}
+        else:
+            pulse = self._pulse(element, statement.namedPulse.name)
+            waveforms = self._pulse_waveforms(pulse, element, duration)
+        if statement.HasField("condition") and not self._eval(statement.condition):
+            element.time += len(waveforms[0])
+            return
+        self._output(element, pulse, waveforms, self._amp(statement))
+
+    def _measure(self, statement) -> None:
+        element = self._element(statement.qe.name)
+        pulse = self._pulse(element, statement.pulse.name)
+        start = element.time
+        self._output(element, pulse, self._pulse_waveforms(pulse, element, None), self._amp(statement))
+        for process in statement.analogMeasureProcesses:
+            self._integrate(element, pulse, start, process)
+
+    # samples
+
+    def _output(self, element: _Element, pulse: dict, waveforms: List[np.ndarray], amp) -> None:
+        start = element.time
+        length = len(waveforms[0])
+        element.time += length
+        if "digital_marker" in pulse:
+            self._digital_marker(element, pulse["digital_marker"], start, length)
+        stop = min(start + length, self._end)
+        if start >= stop:
+            return
+        waveforms = [waveform[:stop - start] for waveform in waveforms]
+        if amp is not None and len(amp) == 4 and len(waveforms) == 2:
+            waveforms = [amp[0] * waveforms[0] + amp[1] * waveforms[1], amp[2] * waveforms[0] + amp[3] * waveforms[1]]
+        elif amp is not None:
+            waveforms = [amp[0] * waveform for waveform in waveforms]
+
+        phase = 2 * math.pi * element.frequency * 1e-9 * np.arange(start, stop) + element.phase
+        cos = np.cos(phase)
+        if len(element.ports) == 1:
+            self._analog[element.ports[0]][start:stop] += waveforms[0] * cos
+            return
+        sin = np.sin(phase)
+        modulated_i = waveforms[0] * cos - waveforms[1] * sin
+        modulated_q = waveforms[0] * sin + waveforms[1] * cos
+        (c00, c01, c10, c11) = element.correction
+        self._analog[element.ports[0]][start:stop] += c00 * modulated_i + c01 * modulated_q
+        self._analog[element.ports[1]][start:stop] += c10 * modulated_i + c11 * modulated_q
+
+    def _digital_marker(self, element: _Element, name: str, start: int, length: int) -> None:
+        marker = np.zeros(length, dtype=bool)
+        position = 0
+        for (value, duration) in self._config["digital_waveforms"][name]["samples"]:
+            stop = length if duration == 0 else min(length, position + duration)
+            marker[position:stop] = bool(value)
+            position = stop
+        for digital_input in element.config.get("digitalInputs", {}).values():
+            buffer = digital_input.get("buffer", 0)
+            # the buffer widens every high segment by `buffer` samples on both sides
+            widened = np.zeros(length + 2 * buffer, dtype=bool)
+            for shift in range(2 * buffer + 1):
+                widened[shift:shift + length] |= marker
+            first = start + digital_input.get("delay", 0) - buffer
+            output = self._digital.setdefault(tuple(digital_input["port"]), np.zeros(self._end, dtype=bool))
+            begin = max(first, 0)
+            stop = min(first + len(widened), self._end)
+            if begin < stop:
+                output[begin:stop] |= widened[begin - first:stop - first]
+
+    def _integrate(self, element: _Element, pulse: dict, start: int, process) -> None:
+        kind = process.WhichOneof("process")
+        if kind not in ("demodIntegration", "bareIntegration"):
+            raise Exception(f"the local simulator does not support {kind} measurements")
+        integration = getattr(process, kind)
+        if integration.target.WhichOneof("processTarget") != "scalarProcess":
+            raise Exception("the local simulator supports only full integration into a scalar")
+        weights = self._config["integration_weights"][pulse["integration_weights"][integration.integration.name]]
+        adc = self._adc(element, process.elementOutput, start + element.config.get("time_of_flight", 0),
+                        pulse["length"])
+        # every weight applies to 4 samples
+        cosine = np.repeat(np.asarray(weights.get("cosine", []), dtype=float), 4)
+        sine = np.repeat(np.asarray(weights.get("sine", []), dtype=float), 4)
+        if kind == "bareIntegration":
+            n = min(len(adc), len(cosine))
+            result = float(np.dot(adc[:n], cosine[:n]))
+        else:
+            n = min(len(adc), len(cosine), len(sine))
+            phase = 2 * math.pi * element.frequency * 1e-9 * np.arange(start, start + n) + element.phase
+            result = float(np.dot(adc[:n], cosine[:n] * np.cos(phase) + sine[:n] * np.sin(phase)))
+        target = integration.target.scalarProcess
+        if target.WhichOneof("target") == "arrayCell":
+            self._set(target.arrayCell.arrayVar.name, self._eval(target.arrayCell.index), result)
+        else:
+            self._set(target.variable.name, 0, result)
+
+    def _adc(self, element: _Element, output: str, start: int, length: int) -> np.ndarray:
+        outputs = element.config.get("outputs", {})
+        if not output and len(outputs) == 1:
+            output = next(iter(outputs))
+        if output not in outputs:
+            raise Exception(f"element {element.name} has no output {output}")
+        adc = np.zeros(length)
+        source = self._loopback.get(tuple(outputs[output]))
+        if source is not None and source in self._analog:
+            # the input sample at time t is the output sample at t - latency, none before the start
+            first = start - self._latency
+            begin = max(first, 0)
+            stop = min(first + length, self._end)
+            if begin < stop:
+                adc[begin - first:stop - first] = self._analog[source][begin:stop]
+        return adc
+
+    def _pulse(self, element: _Element, operation: str) -> dict:
+        operations = element.config.get("operations", {})
+        if operation not in operations:
+            raise Exception(f"element {element.name} has no operation {operation}")
+        return self._config["pulses"][operations[operation]]
+
+    def _pulse_waveforms(self, pulse: dict, element: _Element, duration: Optional[int]) -> List[np.ndarray]:
+        keys = ["single"] if len(element.ports) == 1 else ["I", "Q"]
+        length = pulse["length"] if duration is None else duration
+        return [self._waveform(pulse["waveforms"][key], length) for key in keys]
+
+    def _waveform(self, name: str, length: int) -> np.ndarray:
+        waveform = self._config["waveforms"][name]
+        if waveform["type"] == "constant":
+            return np.full(length, float(waveform["sample"]))
+        samples = self._waveforms.get(name)
+        if samples is None:
+            samples = np.asarray(waveform["samples"], dtype=float)
+            self._waveforms[name] = samples
+        if len(samples) != length:
+            raise Exception(f"the duration of the arbitrary waveform {name} can not be changed")
+        return samples
+
+    def _amp(self, statement) -> Optional[Tuple[float, ...]]:
+        if not statement.HasField("amp"):
+            return None
+        amp = statement.amp
+        if amp.HasField("v1"):
+            return tuple(self._eval(value) for value in (amp.v0, amp.v1, amp.v2, amp.v3))
+        return self._eval(amp.v0),
+
+    def _element(self, name: str) -> _Element:
+        element = self._elements.get(name)
+        if element is None:
+            raise Exception(f"element {name} is not in the config")
+        return element
+
+    # expressions
+
+    def _set(self, name: str, index: int, value) -> None:
+        values = self._values[name]
+        values[index] = type(values[index])(value)
+
+    def _literal(self, literal):
+        if literal.type == _Q.BOOL:
+            return literal.value == "True"
+        if literal.type == _Q.INT:
+            return int(literal.value)
+        return float(literal.value)
+
+    def _eval(self, expression):
+        kind = expression.WhichOneof("expression_oneof")
+        if kind == "literal":
+            return self._literal(expression.literal)
+        if kind == "variable":
+            if expression.variable.WhichOneof("var_oneof") == "ioNumber":
+                raise Exception("the local simulator does not support IO variables")
+            return self._values[expression.variable.name][0]
+        if kind == "binaryOperation":
+            operation = expression.binaryOperation
+            return _BINARY_OPERATIONS[operation.op](self._eval(operation.left), self._eval(operation.right))
+        if kind == "arrayCell":
+            return self._values[expression.arrayCell.arrayVar.name][self._eval(expression.arrayCell.index)]
+        if kind == "arrayLength":
+            return len(self._values[expression.arrayLength.array.name])
+        raise Exception(f"the local simulator does not support {kind} expressions")
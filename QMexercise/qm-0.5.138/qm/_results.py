@@ -1,7 +1,12 @@
 import time
+import queue
+import struct
+import random
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BufferedWriter, BytesIO
-from typing import Optional, Union, Dict, Tuple, Generator
+from typing import Optional, Union, Dict, Tuple, Generator, Callable, List
 import numpy
 import numpy.lib.format as _format
 import json as _json
@@ -47,6 +52,150 @@ class NamedJobResultHeader:
     has_dataloss: bool
 
 
+@dataclass
+class SaveStatistics:
+    results: int
+    bytes: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """Bytes saved per second"""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+def _to_schema(response: GetJobResultSchemaResponse) -> JobResultSchema:
+    return JobResultSchema({
+        item.name:
+            JobResultItemSchema(
+                item.name,
+                _parse_dtype(item.simpleDType),
+                item.isSingle,
+                item.expectedCount
+            )
+        for item in response.items
+    })
+
+
+def _named_header_request(job_id: str, name: str) -> GetJobNamedResultHeaderRequest:
+    request = GetJobNamedResultHeaderRequest()
+    request.jobId = job_id
+    request.outputName = name
+    return request
+
+
+def _to_named_header(response, job_id: str, name: str) -> NamedJobResultHeader:
+    return NamedJobResultHeader(
+        count_so_far=response.countSoFar,
+        is_single=response.isSingle,
+        output_name=name,
+        job_id=job_id,
+        d_type=_parse_dtype(response.simpleDType),
+        done=response.done,
+        closed=response.closed,
+        has_dataloss=response.hasDataloss
+    )
+
+
+def _named_result_request(job_id: str, name: str, start: int, limit: int) -> GetJobNamedResultRequest:
+    request = GetJobNamedResultRequest()
+    request.jobId = job_id
+    request.outputName = name
+    request.longOffset.value = start
+    request.limit = limit
+    return request
+
+
+def _fetch_range(item: Union[int, slice], count_so_far: int) -> Tuple[int, int]:
+    if type(item) is int:
+        start = item
+        stop = item + 1
+        step = None
+    elif type(item) is slice:
+        start = item.start
+        stop = item.stop
+        step = item.step
+    else:
+        raise Exception("fetch supports only int or slice")
+
+    if step != 1 and step is not None:
+        raise Exception("fetch supports step=1 or None in slices")
+
+    if stop is None:
+        stop = count_so_far
+    if start is None:
+        start = 0
+    return start, max(0, min(stop, count_so_far) - start)
+
+
+def _fetch_output(d_type: numpy.dtype, capacity: int, out: Optional[numpy.ndarray]) -> numpy.ndarray:
+    if out is None:
+        return numpy.empty(capacity, dtype=d_type)
+    if out.dtype != d_type or out.ndim != 1 or not out.flags.c_contiguous:
+        raise Exception(f"fetch into an array requires a contiguous one dimensional array of {d_type}")
+    if len(out) < capacity:
+        raise Exception(f"fetch requires an array of at least {capacity} items, got {len(out)}")
+    return out
+
+
+class _ArrayFiller:
+    """Copies the chunks of a named result stream into consecutive items of an array"""
+
+    def __init__(self, out: numpy.ndarray, limit: int, name: str) -> None:
+        super().__init__()
+        self._buffer = memoryview(out.view(numpy.uint8))
+        self._position = 0
+        self._limit = limit
+        self._name = name
+        self.count = 0
+
+    def add(self, result):
+        if self.count + result.countOfItems > self._limit:
+            raise Exception(f"received more than the {self._limit} requested values of {self._name}")
+        size = len(result.data)
+        self._buffer[self._position:self._position + size] = result.data
+        self._position += size
+        self.count += result.countOfItems
+
+
+class _Batcher:
+    """Decodes the chunks of a named result stream and regroups them into arrays of `batch_size` items"""
+
+    def __init__(self, batch_size: Optional[int], d_type: numpy.dtype) -> None:
+        super().__init__()
+        if batch_size is not None and batch_size < 1:
+            raise Exception("batch_size must be a positive number")
+        self._batch_size = batch_size
+        self._dtype = d_type
+        self._pending = []
+        self._pending_count = 0
+
+    def copy(self) -> "_Batcher":
+        return _Batcher(self._batch_size, self._dtype)
+
+    def add(self, result) -> List[numpy.ndarray]:
+        chunk = numpy.frombuffer(result.data, dtype=self._dtype, count=result.countOfItems)
+        if self._batch_size is None:
+            return [chunk]
+        batches = []
+        while len(chunk) > 0:
+            part = chunk[:self._batch_size - self._pending_count]
+            chunk = chunk[len(part):]
+            self._pending.append(part)
+            self._pending_count += len(part)
+            if self._pending_count == self._batch_size:
+                batches.extend(self.flush())
+        return batches
+
+    def flush(self) -> List[numpy.ndarray]:
+        if self._pending_count == 0:
+            return []
+        pending = self._pending
+        self._pending = []
+        self._pending_count = 0
+        return [pending[0] if len(pending) == 1 else numpy.concatenate(pending)]
+
+
 class BaseNamedJobResult:
     def __init__(
             self,
@@ -54,12 +203,17 @@ class BaseNamedJobResult:
             schema: JobResultItemSchema,
             service: JobResultsServiceStub,
             store: BaseStore,
+            header_ttl: float = 0.1,
     ) -> None:
         super().__init__()
         self._job_id = job_id
         self._schema = schema
         self._service = service
         self._store = store
+        self._dtype = _format.descr_to_dtype(schema.dtype)
+        self._header_ttl = header_ttl
+        self._header: Optional[NamedJobResultHeader] = None
+        self._header_time = 0.0
 
     @property
     def name(self) -> str:
@@ -79,23 +233,49 @@ class BaseNamedJobResult:
     def numpy_dtype(self):
         return self._schema.dtype
 
-    def save_to_store(self, writer: Optional[Union[BufferedWriter, BytesIO, str]] = None) -> int:
+    @property
+    def header_ttl(self) -> float:
+        """
+        The time in seconds a header read from the server is reused by `count_so_far`, `has_dataloss`,
+        `is_processing` and `fetch`. Once the result is done or closed its header is final and always reused
+        """
+        return self._header_ttl
+
+    @header_ttl.setter
+    def header_ttl(self, value: float):
+        self._header_ttl = value
+
+    def invalidate_header(self):
+        """Drop the cached header, so the next access reads it from the server"""
+        self._header = None
+
+    def save_to_store(self, writer: Optional[Union[BufferedWriter, BytesIO, str]] = None,
+                      store: Optional[BaseStore] = None) -> int:
         """Saving to persistent store the NPY data of this result handle
 
         :param writer: An optional writer to override the store defined in \
                         :class:`QuantumMachinesManager<qm.QuantumMachinesManager.QuantumMachinesManager>`
+        :param store: An optional store to save to instead of the one defined in \
+                        :class:`QuantumMachinesManager<qm.QuantumMachinesManager.QuantumMachinesManager>`, \
+                        ignored if `writer` is given
         :return: The number of items saved
         """
         own_writer = False
+        alignment = _format.ARRAY_ALIGN
+        store = self._store if store is None else store
         if writer is None:
             own_writer = True
-            writer = self._store.job_named_result(self._job_id, self._schema.name).for_writing()
+            alignment = store.npy_alignment
+            writer = store.job_named_result(self._job_id, self._schema.name).for_writing()
         try:
             header = self._get_named_header()
-            return self._save_to_file(header, writer)
+            count = self._save_to_file(header, writer, alignment)
         finally:
             if own_writer:
                 writer.close()
+        if own_writer:
+            store.named_result_saved(self._job_id, self.name, header, count)
+        return count
 
     def wait_for_values(self, count: int = 1, timeout: Optional[float] = None):
         """Wait until we know at least `count` values were processed for this named result
@@ -104,12 +284,7 @@ class BaseNamedJobResult:
         :param timeout: Timeout for waiting in seconds
         :return:
         """
-        start = time.time()
-        end = start + max(0.0, timeout) if timeout is not None else None
-        while end is None or time.time() < end:
-            if self.count_so_far() >= count:
-                return
-            time.sleep(0.2)
+        ResultsWaiter([self]).wait(lambda headers: headers[self.name].count_so_far >= count, timeout)
 
     def wait_for_all_values(self, timeout: Optional[float] = None) -> bool:
         """Wait until we know all values were processed for this named result
@@ -117,17 +292,14 @@ class BaseNamedJobResult:
         :param timeout: Timeout for waiting in seconds
         :return: True if job finished successfully and False if job has closed before done
         """
-        start = time.time()
-        end = start + max(0.0, timeout) if timeout is not None else None
-        while end is None or time.time() < end:
-            header = self._get_named_header()
-            if header.done or header.closed:
-                return header.done
-            time.sleep(0.2)
-        raise TimeoutError(f"result {self.name} was not done in time")
+        headers = ResultsWaiter([self]).wait(_all_finished, timeout)
+        if headers is None:
+            raise TimeoutError(f"result {self.name} was not done in time")
+        return headers[self.name].done
 
     def is_processing(self) -> bool:
-        return not (self._get_named_header().done or self._get_named_header().closed)
+        header = self._get_named_header()
+        return not (header.done or header.closed)
 
     def count_so_far(self) -> int:
         """
@@ -146,16 +318,27 @@ class BaseNamedJobResult:
         """
         return self._get_named_header().has_dataloss
 
-    def _write_header(self, writer: Union[BufferedWriter, BytesIO, str], count: int):
+    def _write_header(self, writer: Union[BufferedWriter, BytesIO, str], count: int,
+                      alignment: int = _format.ARRAY_ALIGN):
         d_type = self._schema.dtype
-        _format.write_array_header_2_0(writer, {
+        header = {
             "descr": d_type,
             "fortran_order": False,
             "shape": (count,)
-        })
+        }
+        if alignment <= _format.ARRAY_ALIGN:
+            _format.write_array_header_2_0(writer, header)
+            return
+        # pad the header so the data starts on an `alignment` boundary, numpy ignores the padding when reading
+        header = repr(header).encode("latin1")
+        prefix = _format.magic(2, 0)
+        padding = -(len(prefix) + 4 + len(header) + 1) % alignment
+        header = header + b" " * padding + b"\n"
+        writer.write(prefix + struct.pack("<I", len(header)) + header)
 
     def _save_to_file(self, header: NamedJobResultHeader,
-                      writer: Union[BufferedWriter, BytesIO, str]) -> int:
+                      writer: Union[BufferedWriter, BytesIO, str],
+                      alignment: int = _format.ARRAY_ALIGN) -> int:
         count = 0
         request = GetJobNamedResultRequest()
         request.jobId = self._job_id
@@ -169,7 +352,10 @@ class BaseNamedJobResult:
             owning_writer = True
 
         try:
-            self._write_header(writer, header.count_so_far)
+            self._write_header(writer, header.count_so_far, alignment)
+            if header.count_so_far == 0:
+                # a zero limit asks the server for everything
+                return 0
             for result in self._service.GetJobNamedResult(request):
                 count += result.countOfItems
                 writer.write(result.data)
@@ -179,83 +365,275 @@ class BaseNamedJobResult:
                 writer.close()
         return count
 
-    def _get_named_header(self) -> NamedJobResultHeader:
-        request = GetJobNamedResultHeaderRequest()
-        request.jobId = self._job_id
-        request.outputName = self.name
+    def _get_named_header(self, max_age: Optional[float] = None) -> NamedJobResultHeader:
+        header = self._header
+        if header is not None:
+            if header.done or header.closed:
+                return header
+            max_age = self._header_ttl if max_age is None else max_age
+            if time.monotonic() - self._header_time < max_age:
+                return header
+        request = _named_header_request(self._job_id, self.name)
         response = self._service.GetJobNamedResultHeader(request)
-        dtype = _parse_dtype(response.simpleDType)
-        return NamedJobResultHeader(
-            count_so_far=response.countSoFar,
-            is_single=response.isSingle,
-            output_name=self.name,
-            job_id=self.job_id,
-            d_type=dtype,
-            done=response.done,
-            closed=response.closed,
-            has_dataloss=response.hasDataloss
-        )
+        header = _to_named_header(response, self._job_id, self.name)
+        self._header = header
+        self._header_time = time.monotonic()
+        return header
 
     def fetch_all(self):
         return self.fetch(slice(0, len(self)))
 
-    def fetch(self, item: Union[int, slice]) -> numpy.array:
+    def fetch(self, item: Union[int, slice], out: Optional[numpy.ndarray] = None) -> numpy.array:
         """
         Fetch the current value of the result from the server into local memory
 
-        :return:
+        The values are written directly into a preallocated array as they arrive from the server.
+
+        :param item: The index or slice of values to fetch
+        :param out: An optional one dimensional array of the result dtype to fetch into, instead of \
+                    allocating a new one. It must be large enough to hold all the requested values
+        :return: The fetched values, a view into `out` if it was given
         """
-        if type(item) is int:
-            start = item
-            stop = item + 1
-            step = None
-        elif type(item) is slice:
-            start = item.start
-            stop = item.stop
-            step = item.step
+        header = self._get_named_header()
+        (start, capacity) = _fetch_range(item, header.count_so_far)
+        out = _fetch_output(self._dtype, capacity, out)
+        count = self._fetch_into(start, capacity, out)
+
+        if header.has_dataloss:
+            logger.warning(f"Results variable {self.name} has data loss")
+
+        return out[:count]
+
+    def _fetch_into(self, start: int, limit: int, out: numpy.ndarray) -> int:
+        if limit == 0:
+            # a zero limit asks the server for everything
+            return 0
+
+        request = _named_result_request(self._job_id, self.name, start, limit)
+        filler = _ArrayFiller(out, limit, self.name)
+        for result in self._service.GetJobNamedResult(request):
+            filler.add(result)
+        return filler.count
+
+    def cursor(self) -> "NamedJobResultCursor":
+        """
+        Create a cursor that fetches only the values added since its last update.
+        Use it instead of calling `fetch_all` repeatedly while the job is running
+
+        :return: A new :class:`NamedJobResultCursor` starting at offset 0
+        """
+        return NamedJobResultCursor(self)
+
+
+class NamedJobResultCursor:
+    """
+    Incrementally fetches a named result into a growing local buffer
+
+    Every call to :func:`update` requests only the values after the last offset read::
+
+        cursor = job.result_handles.get("I").cursor()
+        while job.result_handles.is_processing():
+            new_values = cursor.update()
+            plot(cursor.values)
+
+    """
+
+    def __init__(self, result: BaseNamedJobResult) -> None:
+        super().__init__()
+        self._result = result
+        self._buffer = numpy.empty(0, dtype=result._dtype)
+        self._count = 0
+        self._last = 0
+        self._warned_dataloss = False
+
+    @property
+    def offset(self) -> int:
+        """The number of values read so far"""
+        return self._count
+
+    @property
+    def values(self) -> numpy.array:
+        """All the values read so far, without fetching"""
+        return self._buffer[:self._count]
+
+    @property
+    def new_values(self) -> numpy.array:
+        """The values read by the last call to :func:`update`, without fetching"""
+        return self._buffer[self._last:self._count]
+
+    def update(self) -> numpy.array:
+        """
+        Fetch the values added since the last update
+
+        :return: The new values, same as :attr:`new_values`
+        """
+        header = self._result._get_named_header(max_age=0)
+        self._last = self._count
+        available = header.count_so_far - self._count
+        if available > 0:
+            self._reserve(header.count_so_far)
+            self._count += self._result._fetch_into(self._count, available, self._buffer[self._count:])
+        if header.has_dataloss and not self._warned_dataloss:
+            self._warned_dataloss = True
+            logger.warning(f"Results variable {self._result.name} has data loss")
+        return self.new_values
+
+    def _reserve(self, size: int):
+        if size <= len(self._buffer):
+            return
+        buffer = numpy.empty(max(size, 2 * len(self._buffer)), dtype=self._buffer.dtype)
+        buffer[:self._count] = self._buffer[:self._count]
+        self._buffer = buffer
+
+
+def _all_finished(headers: Dict[str, NamedJobResultHeader]) -> bool:
+    return all(header.done or header.closed for header in headers.values())
+
+
+# the polling interval of waiting on results. It never exceeds the fixed interval it used to be by default,
+# so a wait notices that results are done as soon as it did; pass a larger max_interval to back off further
+POLL_MIN_INTERVAL = 0.2
+POLL_MAX_INTERVAL = 0.2
+POLL_JITTER = 0.2
+
+
+class _Backoff:
+    """
+    Polling interval that starts at its minimum, stays there while result counts change and doubles, with jitter,
+    while they do not. It never polls faster than the minimum just because values keep arriving, nor slower than the
+    maximum
+    """
+
+    def __init__(self, timeout: Optional[float], min_interval: float, max_interval: float, jitter: float) -> None:
+        super().__init__()
+        self._end = time.time() + max(0.0, timeout) if timeout is not None else None
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._jitter = jitter
+        self._interval = min_interval
+        self._last_counts = None
+
+    def next_delay(self, headers: Dict[str, NamedJobResultHeader]) -> Optional[float]:
+        """
+        :return: The time to sleep before the next round, or None if the timeout has passed
+        """
+        now = time.time()
+        if self._end is not None and now >= self._end:
+            return None
+        counts = {name: header.count_so_far for (name, header) in headers.items()}
+        if self._last_counts is None or counts != self._last_counts:
+            self._interval = self._min_interval
         else:
-            raise Exception("fetch supports only int or slice")
+            self._interval = min(self._max_interval, self._interval * 2)
+        self._last_counts = counts
+        delay = min(self._max_interval, self._interval * random.uniform(1 - self._jitter, 1 + self._jitter))
+        if self._end is not None:
+            delay = min(delay, self._end - now)
+        return delay
 
-        if step != 1 and step is not None:
-            raise Exception("fetch supports step=1 or None in slices")
 
-        header = self._get_named_header()
-        if stop is None:
-            stop = header.count_so_far
-        if start is None:
-            start = 0
+class ResultsWaiter:
+    """
+    Waits on several named results together
 
-        d_type = self._schema.dtype
+    Every polling round reads the headers of all the results once, concurrently on a small thread pool.
+    The interval between rounds adapts to the results: it stays at `min_interval` while new values keep arriving
+    and backs off exponentially, with random jitter, up to `max_interval` while nothing changes.
 
-        writer = BytesIO()
-        count = 0
-        request = GetJobNamedResultRequest()
-        request.jobId = self._job_id
-        request.outputName = self._schema.name
-        request.longOffset.value = start
-        request.limit = stop - start
+    Callbacks can be registered to be called once when a result reaches a number of values::
 
-        data_writer = BytesIO()
-        for result in self._service.GetJobNamedResult(request):
-            count += result.countOfItems
-            data_writer.write(result.data)
+        waiter = job.result_handles.waiter()
+        waiter.on_count("I", 1000, lambda header: print("got 1000 values"))
+        waiter.wait_for_all_values()
 
-        _format.write_array_header_2_0(writer, {
-            "descr": d_type,
-            "fortran_order": False,
-            "shape": (count,)
-        })
+    """
 
-        data_writer.seek(0)
-        for d in data_writer:
-            writer.write(d)
+    def __init__(
+            self,
+            results: List[BaseNamedJobResult],
+            min_interval: float = POLL_MIN_INTERVAL,
+            max_interval: float = POLL_MAX_INTERVAL,
+            jitter: float = POLL_JITTER,
+            max_workers: int = 4,
+    ) -> None:
+        super().__init__()
+        self._results = list(results)
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._jitter = jitter
+        self._max_workers = max_workers
+        self._callbacks: List[Tuple[str, int, Callable[[NamedJobResultHeader], None]]] = []
 
-        writer.seek(0)
+    def on_count(self, name: str, count: int,
+                 callback: Callable[[NamedJobResultHeader], None]) -> "ResultsWaiter":
+        """Call `callback` with the header of result `name` once it has at least `count` values
 
-        if header.has_dataloss:
-            logger.warning(f"Results variable {self.name} has data loss")
+        The callback is called from the waiting thread, during :func:`wait`
+
+        :return: This waiter, for chaining
+        """
+        self._callbacks.append((name, count, callback))
+        return self
+
+    def poll(self) -> Dict[str, NamedJobResultHeader]:
+        """Read the headers of all the results once
+
+        :return: The headers by result name
+        """
+        return self._poll(None)
+
+    def wait(self, condition: Callable[[Dict[str, NamedJobResultHeader]], bool],
+             timeout: Optional[float] = None) -> Optional[Dict[str, NamedJobResultHeader]]:
+        """Poll the results until `condition` holds for the headers of a round
+
+        :param condition: Called with the headers by result name after every round
+        :param timeout: Timeout for waiting in seconds
+        :return: The headers that satisfied `condition`, or None on timeout
+        """
+        backoff = _Backoff(timeout, self._min_interval, self._max_interval, self._jitter)
+        executor = None
+        if len(self._results) > 1:
+            executor = ThreadPoolExecutor(max_workers=min(self._max_workers, len(self._results)))
+        try:
+            while True:
+                headers = self._poll(executor)
+                self._run_callbacks(headers)
+                if condition(headers):
+                    return headers
+                delay = backoff.next_delay(headers)
+                if delay is None:
+                    return None
+                time.sleep(delay)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
 
-        return numpy.load(writer)
+    def wait_for_all_values(self, timeout: Optional[float] = None) -> bool:
+        """Wait until we know all values were processed for all the results
+
+        :param timeout: Timeout for waiting in seconds
+        :return: True if all finished successfully, False if any result was closed before done
+        """
+        headers = self.wait(_all_finished, timeout)
+        if headers is None:
+            raise TimeoutError("results were not done in time")
+        return all(header.done for header in headers.values())
+
+    def _poll(self, executor: Optional[ThreadPoolExecutor]) -> Dict[str, NamedJobResultHeader]:
+        if executor is None:
+            headers = [result._get_named_header(max_age=0) for result in self._results]
+        else:
+            headers = list(executor.map(lambda result: result._get_named_header(max_age=0), self._results))
+        return {result.name: header for (result, header) in zip(self._results, headers)}
+
+    def _run_callbacks(self, headers: Dict[str, NamedJobResultHeader]):
+        pending = []
+        for (name, count, callback) in self._callbacks:
+            if name in headers and headers[name].count_so_far >= count:
+                callback(headers[name])
+            else:
+                pending.append((name, count, callback))
+        self._callbacks = pending
 
 
 class MultipleNamedJobResult(BaseNamedJobResult):
@@ -263,55 +641,72 @@ class MultipleNamedJobResult(BaseNamedJobResult):
     A handle to a result of a pipeline terminating with ``save_all``
     """
     def __init__(self, job_id: str, schema: JobResultItemSchema, service: JobResultsServiceStub,
-                 store: BaseStore
+                 store: BaseStore, header_ttl: float = 0.1
                  ) -> None:
         if schema.is_single:
             raise Exception("expecting a multi-result schema")
-        super().__init__(job_id, schema, service, store)
+        super().__init__(job_id, schema, service, store, header_ttl)
 
     def _wait_for_any_value(self):
         self.wait_for_values(count=1, timeout=0.5)
 
-    def fetcher(self):
+    def fetcher(self, batch_size: Optional[int] = None):
+        """
+        A generator function that streams the values of this result one item at a time
+
+        The items are views into the arrays produced by :func:`batch_fetcher`
+
+        :param batch_size: The number of items decoded together, see :func:`batch_fetcher`
+        """
+        batches = self.batch_fetcher(batch_size)
+
         def fetcher():
-            self._wait_for_any_value()
-            request = GetJobNamedResultRequest()
-            request.jobId = self._job_id
-            request.outputName = self.name
-            request.longOffset.value = 0
-            request.limit = 0
+            for batch in batches():
+                yield from batch
+
+        return fetcher
+
+    def batch_fetcher(self, batch_size: Optional[int] = None):
+        """
+        A generator function that streams the values of this result as numpy arrays
 
-            header_writer = BytesIO()
-            self._write_header(header_writer, 1)
-            header_value = header_writer.getvalue()
+        Each chunk received from the server is decoded at once into a read-only array backed by the received bytes
 
+        :param batch_size: When given, the chunks are regrouped into arrays of exactly `batch_size` items \
+                    (except for the last one), otherwise every chunk is yielded as it arrives
+        """
+        batcher_type = _Batcher(batch_size, self._dtype)
+
+        def fetcher():
+            self._wait_for_any_value()
+            request = _named_result_request(self._job_id, self.name, 0, 0)
+            batcher = batcher_type.copy()
             named_result = self._service.GetJobNamedResult(request)
             for result in named_result:
-                item_count = result.countOfItems
-                total_bytes = len(result.data)
-                bytes_per_item = total_bytes // item_count
-                writer = BytesIO()
-                for i in range(0, item_count):
-                    item_bytes = result.data[i * bytes_per_item:(i + 1) * bytes_per_item]
-                    writer.seek(0)
-                    writer.write(header_value)
-                    writer.write(item_bytes)
-                    writer.seek(0)
-                    ar = numpy.load(writer)
-                    yield ar[0]
+                yield from batcher.add(result)
+            yield from batcher.flush()
 
         return fetcher
 
 
+def _single_value(value: numpy.array):
+    if len(value) == 0:
+        return None
+    elif len(value[0]) == 1:
+        return value[0][0]
+    else:
+        return value[0]
+
+
 class SingleNamedJobResult(BaseNamedJobResult):
     """
     A handle to a result of a pipeline terminating with ``save``
     """
     def __init__(self, job_id: str, schema: JobResultItemSchema, service: JobResultsServiceStub,
-                 store: BaseStore) -> None:
+                 store: BaseStore, header_ttl: float = 0.1) -> None:
         if not schema.is_single:
             raise Exception("expecting a single-result schema")
-        super().__init__(job_id, schema, service, store)
+        super().__init__(job_id, schema, service, store, header_ttl)
 
     def wait_for_values(self, count: int = 1, timeout: Optional[float] = None):
         if count != 1:
@@ -331,13 +726,48 @@ class SingleNamedJobResult(BaseNamedJobResult):
         """
         if (isinstance(item, int) and item != 0) or isinstance(item, slice):
             logger.warning("Fetching single result will always return the single value")
-        value = super().fetch(0)
-        if len(value) == 0:
-            return None
-        elif len(value[0]) == 1:
-            return value[0][0]
-        else:
-            return value[0]
+        return _single_value(super().fetch(0))
+
+
+_END_OF_RESULT = object()
+
+# the chunks a download gets ahead of the writer, so a slow disk does not buffer whole results in memory
+_MAX_QUEUED_CHUNKS = 16
+
+
+class _DownloadCancelled(Exception):
+    pass
+
+
+def _put_chunk(chunks: queue.Queue, data, cancelled: threading.Event):
+    # waits for the writer, unless it stopped reading
+    while True:
+        try:
+            chunks.put(data, timeout=0.1)
+            return
+        except queue.Full:
+            if cancelled.is_set():
+                raise _DownloadCancelled()
+
+
+def _download_npy(result: BaseNamedJobResult, chunks: queue.Queue, cancelled: threading.Event):
+    try:
+        header = result._get_named_header()
+        header_writer = BytesIO()
+        result._write_header(header_writer, header.count_so_far)
+        _put_chunk(chunks, header_writer.getvalue(), cancelled)
+        if header.count_so_far > 0:
+            request = _named_result_request(result.job_id, result.name, 0, header.count_so_far)
+            for item in result._service.GetJobNamedResult(request):
+                _put_chunk(chunks, item.data, cancelled)
+        _put_chunk(chunks, _END_OF_RESULT, cancelled)
+    except _DownloadCancelled:
+        pass
+    except BaseException as e:
+        try:
+            _put_chunk(chunks, e, cancelled)
+        except _DownloadCancelled:
+            pass
 
 
 class JobResults:
@@ -361,9 +791,13 @@ class JobResults:
             print("somename exists!")
             handle = job_results.get("somename")
 
+    The handles reuse the header of their result for `header_ttl` seconds, see
+    :attr:`BaseNamedJobResult.header_ttl`
+
     """
 
-    def __init__(self, job_id: str, service: JobResultsServiceStub, store: BaseStore) -> None:
+    def __init__(self, job_id: str, service: JobResultsServiceStub, store: BaseStore,
+                 header_ttl: float = 0.1) -> None:
         super().__init__()
         self._job_id = job_id
         self._service = service
@@ -373,9 +807,9 @@ class JobResults:
         self._all_results: Dict[str, BaseNamedJobResult] = {}
         for (name, item_schema) in schema.items.items():
             if item_schema.is_single:
-                result = SingleNamedJobResult(job_id, item_schema, service, store)
+                result = SingleNamedJobResult(job_id, item_schema, service, store, header_ttl)
             else:
-                result = MultipleNamedJobResult(job_id, item_schema, service, store)
+                result = MultipleNamedJobResult(job_id, item_schema, service, store, header_ttl)
             self._all_results[name] = result
             if not hasattr(self, name):
                 setattr(self, name, result)
@@ -392,43 +826,73 @@ class JobResults:
         key = list(self._all_results.keys())[0]
         return self._all_results[key].is_processing()
 
-    def save_to_store(self, writer: Optional[Union[BufferedWriter, BytesIO, str]] = None):
+    def save_to_store(
+            self,
+            writer: Optional[Union[BufferedWriter, BytesIO, str]] = None,
+            compression: int = zipfile.ZIP_DEFLATED,
+            compresslevel: Optional[int] = None,
+            max_workers: int = 4,
+    ) -> SaveStatistics:
         """Save all results to store (file system by default) in a single NPZ file
 
+        The named results are downloaded concurrently, each into its own queue of chunks, while the calling
+        thread streams the chunks into the archive entries, compressing them as they are written.
+
         :param writer: An optional writer to be used instead of the pre-populated \
             store passed to :class:`qm.QuantumMachinesManager.QuantumMachinesManager`
+        :param compression: The zipfile compression of the entries, use ``zipfile.ZIP_STORED`` for no compression \
+            which is usually best for large noisy float data
+        :param compresslevel: The compression level, e.g. 1 for fast deflate, None for the zlib default
+        :param max_workers: The maximum number of named results downloaded at the same time
+        :return: The number of results and bytes saved and the time it took
         """
         own_writer = False
         if writer is None:
             own_writer = True
             writer = self._store.all_job_results(self._job_id).for_writing()
+        start = time.time()
+        total_bytes = 0
+        results = list(self)
+        chunk_queues = [queue.Queue(maxsize=_MAX_QUEUED_CHUNKS) for _ in results]
+        cancelled = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(results))))
         zipf = None
         try:
-            zipf = zipfile.ZipFile(writer, allowZip64=True, mode="w", compression=zipfile.ZIP_DEFLATED)
-            for (name, result) in self:
-                with zipf.open(f"{name}.npy", "w") as entry:
-                    result.save_to_store(entry)
-                pass
+            for ((name, result), chunks) in zip(results, chunk_queues):
+                executor.submit(_download_npy, result, chunks, cancelled)
+            zipf = zipfile.ZipFile(writer, allowZip64=True, mode="w", compression=compression,
+                                   compresslevel=compresslevel)
+            for ((name, result), chunks) in zip(results, chunk_queues):
+                with zipf.open(f"{name}.npy", "w", force_zip64=True) as entry:
+                    while True:
+                        data = chunks.get()
+                        if data is _END_OF_RESULT:
+                            break
+                        if isinstance(data, BaseException):
+                            raise data
+                        entry.write(data)
+                        total_bytes += len(data)
         finally:
-            zipf.close()
+            # downloads waiting on a full queue give up once nothing reads it
+            cancelled.set()
+            executor.shutdown(wait=False)
+            if zipf is not None:
+                zipf.close()
             if own_writer:
                 writer.close()
 
+        statistics = SaveStatistics(len(results), total_bytes, time.time() - start)
+        logger.info(f"Saved {statistics.results} results of job {self._job_id}, "
+                    f"{statistics.bytes / 1e6:.1f} MB in {statistics.seconds:.2f} s "
+                    f"({statistics.throughput / 1e6:.1f} MB/s)")
+        return statistics
+
     @staticmethod
     def _load_schema(job_id: str, service: JobResultsServiceStub) -> JobResultSchema:
         request = GetJobResultSchemaRequest()
         request.jobId = job_id
         response: GetJobResultSchemaResponse = service.GetJobResultSchema(request)
-        return JobResultSchema({
-            item.name:
-                JobResultItemSchema(
-                    item.name,
-                    _parse_dtype(item.simpleDType),
-                    item.isSingle,
-                    item.expectedCount
-                )
-            for item in response.items
-        })
+        return _to_schema(response)
 
     def get(self, name: str) -> Optional[Union[MultipleNamedJobResult, SingleNamedJobResult]]:
         """Get a handle to a named result from :func:`stream_processing<qm.qua._dsl.stream_processing>`
@@ -443,21 +907,19 @@ class JobResults:
     def __contains__(self, name: str):
         return name in self._all_results
 
+    def waiter(self, **kwargs) -> ResultsWaiter:
+        """Create a :class:`ResultsWaiter` polling all the named results of this job together
+
+        :param kwargs: Passed to :class:`ResultsWaiter`
+        """
+        return ResultsWaiter(list(self._all_results.values()), **kwargs)
+
     def wait_for_all_values(self, timeout: Optional[float] = None) -> bool:
         """Wait until we know all values were processed for all named results
 
+        All the named results are polled together on every round, see :class:`ResultsWaiter`
+
         :param timeout: Timeout for waiting in seconds
         :return: True if all finished successfully, False if any result was closed before done
         """
-        start = time.time()
-        end: Optional[int] = start + max(0.0, timeout) if timeout is not None else None
-        keys = list(self._all_results.keys())
-        all_done = True
-        while len(keys) > 0 and (end is None or time.time() < end):
-            result = self._all_results[keys[0]]
-            time_remaining = None
-            if end is not None:
-                time_remaining = max(0.0, end - time.time())
-            all_done = all_done and result.wait_for_all_values(time_remaining)
-            keys = keys[1:]
-        return all_done
+        return self.waiter().wait_for_all_values(timeout)
@@ -1,5 +1,10 @@
+import json
+import threading
+from datetime import datetime
+from typing import Dict
 from typing.io import BinaryIO
 from pathlib import Path
+import numpy
 
 
 class BinaryAsset:
@@ -15,6 +20,9 @@ class BaseStore:
     The interface to saving data from a running QM job
     """
 
+    npy_alignment = 64
+    """The alignment, in bytes, of the data in the NPY files of named results written to this store"""
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -24,6 +32,14 @@ class BaseStore:
     def all_job_results(self, job_id: str) -> BinaryAsset:
         raise NotImplementedError()
 
+    def named_result_saved(self, job_id: str, name: str, header, count: int) -> None:
+        """Called after a named result was written to :func:`job_named_result`
+
+        :param header: The :class:`NamedJobResultHeader<qm._results.NamedJobResultHeader>` the result was saved with
+        :param count: The number of items saved
+        """
+        pass
+
 
 class FileBinaryAsset(BinaryAsset):
     def __init__(self, path: Path) -> None:
@@ -52,3 +68,88 @@ class SimpleFileStore(BaseStore):
 
     def all_job_results(self, job_id: str) -> BinaryAsset:
         return FileBinaryAsset(self._job_path(job_id).joinpath(f"results.npz"))
+
+
+class MemmapFileStore(SimpleFileStore):
+    """
+    A store for large results that are read back with memory mapping
+
+    Every named result is saved as an uncompressed NPY file whose data starts on a page boundary,
+    and is indexed in a ``manifest.json`` file in the job directory with its dtype, count,
+    data loss flag and save time. Save all the results of a job with :func:`save_job`.
+
+    Reading a result maps the file instead of loading it, so slicing touches only the pages needed::
+
+        store = MemmapFileStore("results")
+        store.save_job(job.result_handles)
+        ...
+        I = store.load(job_id, "I")
+        first_values = I[:1000]
+
+    """
+
+    npy_alignment = 4096
+
+    def __init__(self, root: str = '.') -> None:
+        super().__init__(root)
+        self._manifest_lock = threading.Lock()
+
+    def _manifest_path(self, job_id: str) -> Path:
+        return self._job_path(job_id).joinpath("manifest.json")
+
+    def manifest(self, job_id: str) -> Dict[str, dict]:
+        """
+        :return: The manifest entries of the saved named results of the job, by name
+        """
+        path = self._manifest_path(job_id)
+        if not path.exists():
+            return {}
+        with path.open("r") as file:
+            return json.load(file)["results"]
+
+    def named_result_saved(self, job_id: str, name: str, header, count: int) -> None:
+        with self._manifest_lock:
+            results = self.manifest(job_id)
+            results[name] = {
+                "file": f"result_{name}.npy",
+                "dtype": header.d_type,
+                "count": count,
+                "has_dataloss": header.has_dataloss,
+                "done": header.done,
+                "saved_at": datetime.now().isoformat(),
+            }
+            path = self._manifest_path(job_id)
+            temp_path = path.with_suffix(".json.tmp")
+            with temp_path.open("w") as file:
+                json.dump({"job_id": job_id, "updated_at": datetime.now().isoformat(), "results": results}, file,
+                          indent=2)
+            temp_path.replace(path)
+
+    def save_job(self, job_results) -> Dict[str, int]:
+        """Save every named result of a job to its own file
+
+        :param job_results: The :class:`JobResults<qm._results.JobResults>` of the job
+        :return: The number of items saved by result name
+        """
+        return {name: handle.save_to_store(store=self) for (name, handle) in job_results}
+
+    def load(self, job_id: str, name: str, mode: str = "r") -> numpy.memmap:
+        """Open a saved named result without reading it
+
+        :param mode: The ``numpy.memmap`` mode, "r" for read only or "c" for copy on write
+        :return: A memory mapped array of the result values
+        """
+        entry = self.manifest(job_id).get(name)
+        file_name = entry["file"] if entry is not None else f"result_{name}.npy"
+        path = self._job_path(job_id).joinpath(file_name)
+        if entry is not None and entry["count"] == 0:
+            # an empty region can't be mapped
+            return numpy.load(path)
+        return numpy.load(path, mmap_mode=mode)
+
+    def load_job(self, job_id: str, mode: str = "r") -> Dict[str, numpy.memmap]:
+        """Open all the saved named results of a job without reading them
+
+        :return: Memory mapped arrays by result name
+        """
+        return {name: self.load(job_id, name, mode) for name in self.manifest(job_id)}
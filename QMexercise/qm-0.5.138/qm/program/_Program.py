@@ -2,6 +2,8 @@ from typing import Optional
 
 from qm.pb.inc_qua_pb2 import QuaProgram, QuaResultAnalysis
 from qm.program.StatementsCollection import StatementsCollection
+from qm.program.expressions import LiteralArray
+from qm.program._ProgramTemplate import ProgramTemplate, find_placeholders
 from qm.program._ResultAnalysis import _ResultAnalysis
 
 
@@ -14,6 +16,8 @@ class _Program:
         self._program.script.body.SetInParent()
         self._qua_config = config
         self._result_analysis = _ResultAnalysis(self._program.resultAnalysis)
+        self._placeholders = {}
+        self._has_unmarked_placeholders = False
 
     def _declare_var(self, name, var_type, size, value):
         declaration = self._program.script.variables.add()
@@ -22,6 +26,10 @@ class _Program:
         declaration.size = size
         if value is None:
             pass
+        elif type(value) is LiteralArray:
+            add = declaration.value.add
+            for literal in value.values:
+                add(value=literal, type=value.type, loc=value.loc)
         elif type(value) is list:
             for i in value:
                 added_value = declaration.value.add()
@@ -47,7 +55,37 @@ class _Program:
     def result_analysis(self) -> _ResultAnalysis:
         return self._result_analysis
 
+    def template(self) -> ProgramTemplate:
+        """
+        Make a template of the program, in which the literals created with ``placeholder()`` can be set
+        to new values much faster than building the program again::
+
+            with program() as prog:
+                t = declare(int)
+                assign(t, placeholder("wait_time", 16))
+                wait(t, "qubit")
+
+            template = prog.template()
+            programs = [template.bind(wait_time=w) for w in range(16, 10000, 4)]
+
+        :return: The template, the program itself keeps the values the placeholders were made with
+        """
+        self._unmark_placeholders()
+        copy = QuaProgram()
+        copy.CopyFrom(self._program)
+        return ProgramTemplate(copy, {name: list(paths) for (name, paths) in self._placeholders.items()},
+                               self._qua_config)
+
+    def placeholder_added(self):
+        self._has_unmarked_placeholders = True
+
+    def _unmark_placeholders(self):
+        if self._has_unmarked_placeholders:
+            find_placeholders(self._program, self._placeholders)
+            self._has_unmarked_placeholders = False
+
     def build(self, config):
+        self._unmark_placeholders()
         copy = QuaProgram()
         copy.CopyFrom(self._program)
         copy.config.CopyFrom(config)
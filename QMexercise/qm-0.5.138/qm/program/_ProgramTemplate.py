@@ -0,0 +1,100 @@
+from typing import Dict, List, Optional, Tuple
+
+from qm.pb.inc_qua_pb2 import QuaProgram
+from qm.utils import fix_object_data_type as _fix_object_data_type
+
+_PLACEHOLDER_MARKER = "\x00placeholder:"
+_LITERAL_DESCRIPTOR = QuaProgram.LiteralExpression.DESCRIPTOR
+
+# the (field name, index in a repeated field or None) steps from the program message to a literal
+_Path = Tuple[Tuple[str, Optional[int]], ...]
+
+
+def placeholder_loc(name: str, loc: str) -> str:
+    """The location of a placeholder literal, which marks it until the template is made"""
+    return _PLACEHOLDER_MARKER + name + "\x00" + loc
+
+
+def find_placeholders(program: QuaProgram, found: Dict[str, List[Tuple[_Path, int]]]):
+    """
+    Add the paths of the placeholder literals of the program to `found` and remove their marks
+    """
+    _find_placeholders(program, (), found)
+
+
+def _find_placeholders(message, path: _Path, found: Dict[str, List[Tuple[_Path, int]]]):
+    for (field, value) in message.ListFields():
+        if field.type != field.TYPE_MESSAGE:
+            continue
+        if field.label == field.LABEL_REPEATED:
+            for (i, item) in enumerate(value):
+                _visit(item, path + ((field.name, i),), found)
+        else:
+            _visit(value, path + ((field.name, None),), found)
+
+
+def _visit(message, path: _Path, found: Dict[str, List[Tuple[_Path, int]]]):
+    if message.DESCRIPTOR is _LITERAL_DESCRIPTOR:
+        if message.loc.startswith(_PLACEHOLDER_MARKER):
+            (name, loc) = message.loc[len(_PLACEHOLDER_MARKER):].split("\x00", 1)
+            message.loc = loc
+            found.setdefault(name, []).append((path, message.type))
+    else:
+        _find_placeholders(message, path, found)
+
+
+def _format(name: str, literal_type: int, value) -> str:
+    value = _fix_object_data_type(value)
+    if literal_type == QuaProgram.BOOL:
+        if type(value) is not bool:
+            raise Exception(f"placeholder {name} must be bound to a bool")
+    elif literal_type == QuaProgram.INT:
+        if type(value) is not int:
+            raise Exception(f"placeholder {name} must be bound to an int")
+    else:
+        if type(value) not in (int, float):
+            raise Exception(f"placeholder {name} must be bound to a float")
+        value = float(value)
+    return str(value)
+
+
+class ProgramTemplate:
+    """
+    A program whose placeholder literals can be rebound without building it again, see ``_Program.template``
+    """
+
+    def __init__(self, program: QuaProgram, placeholders: Dict[str, List[Tuple[_Path, int]]], config=None):
+        super().__init__()
+        self._program = program
+        self._placeholders = placeholders
+        self._qua_config = config
+
+    @property
+    def placeholders(self) -> List[str]:
+        """The names of the placeholders of the program"""
+        return list(self._placeholders)
+
+    def bind(self, **values):
+        """
+        :param values: The values of placeholders by name, placeholders not given keep the value they were made with
+        :return: A copy of the program with the literals of the placeholders set to the values
+        """
+        from qm.program._Program import _Program
+
+        unknown = set(values).difference(self._placeholders)
+        if unknown:
+            raise Exception(f"unknown placeholders {', '.join(sorted(unknown))}")
+
+        copy = QuaProgram()
+        copy.CopyFrom(self._program)
+        for (name, value) in values.items():
+            for (path, literal_type) in self._placeholders[name]:
+                literal = copy
+                for (field_name, index) in path:
+                    literal = getattr(literal, field_name)
+                    if index is not None:
+                        literal = literal[index]
+                literal.value = _format(name, literal_type, value)
+        bound = _Program(self._qua_config, copy)
+        bound._placeholders = self._placeholders
+        return bound
@@ -1,2 +1,3 @@
 from qm.program._Program import _Program
 from qm.program._qua_config_schema import load_config
+from qm.program._config_cache import set_config_cache_dir, clear_config_cache
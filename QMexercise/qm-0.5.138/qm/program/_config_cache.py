@@ -0,0 +1,162 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import numpy
+
+from qm.pb.inc_qua_config_pb2 import QuaConfig
+from qm._logger import logger
+
+_MAX_IN_MEMORY = 32
+
+# the key also depends on the schema code, so a cache on disk is not reused after upgrading qm
+_schema_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_qua_config_schema.py")
+
+_lock = threading.Lock()
+_in_memory = OrderedDict()
+_cache_dir = os.environ.get("QM_CONFIG_CACHE_DIR") or None
+_schema_digest = None
+
+_SCALARS = (str, int, float, bool, type(None))
+
+# flat lists of a single one of these types are hashed as the bytes of a numpy array of that dtype
+_NUMERIC_LISTS = {float: numpy.float64, int: numpy.int64}
+
+
+class _Unhashable(Exception):
+    pass
+
+
+def set_config_cache_dir(path: Optional[str]):
+    """
+    Also keep loaded configs on disk, so they are reused by later sessions.
+    It can also be set with the environment variable ``QM_CONFIG_CACHE_DIR``
+
+    :param path: The directory to keep them in, None to keep them in memory only
+    """
+    global _cache_dir
+    if path is not None:
+        os.makedirs(path, exist_ok=True)
+    _cache_dir = path
+
+
+def clear_config_cache():
+    """Forget the configs loaded so far, the ones on disk are left in place"""
+    with _lock:
+        _in_memory.clear()
+
+
+def _get_schema_digest() -> bytes:
+    global _schema_digest
+    if _schema_digest is None:
+        with open(_schema_file, "rb") as file:
+            _schema_digest = hashlib.sha256(file.read()).digest()
+    return _schema_digest
+
+
+def _update(digest, value):
+    value_type = type(value)
+    if value_type in _SCALARS:
+        digest.update(b"s" + repr(value).encode())
+    elif isinstance(value, dict):
+        digest.update(b"d%d" % len(value))
+        for key in sorted(value, key=repr):
+            _update(digest, key)
+            _update(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update((b"l%d" if isinstance(value, list) else b"t%d") % len(value))
+        item_types = set(map(type, value))
+        if len(item_types) == 1 and next(iter(item_types)) in _NUMERIC_LISTS:
+            # waveform samples and integration weights, hashing their repr would take longer than loading them
+            (item_type,) = item_types
+            try:
+                array = numpy.asarray(value, dtype=_NUMERIC_LISTS[item_type])
+            except OverflowError:
+                array = None
+            if array is not None:
+                digest.update(b"n" + item_type.__name__.encode())
+                digest.update(array.tobytes())
+                return
+        if item_types.issubset(_SCALARS):
+            digest.update(repr(value).encode())
+        else:
+            for item in value:
+                _update(digest, item)
+    elif hasattr(value, "dtype") and hasattr(value, "tobytes") and not value.dtype.hasobject:
+        digest.update(b"a" + str(value.dtype).encode() + repr(getattr(value, "shape", ())).encode())
+        digest.update(value.tobytes())
+    else:
+        raise _Unhashable(value_type)
+
+
+def config_hash(config) -> Optional[str]:
+    """
+    :return: A digest of the content of the config, None if it holds values that can not be hashed reliably
+    """
+    digest = hashlib.sha256(_get_schema_digest())
+    try:
+        _update(digest, config)
+    except _Unhashable as error:
+        logger.debug(f"config is not cached, it holds a value of type {error.args[0]}")
+        return None
+    return digest.hexdigest()
+
+
+def _copy(config: QuaConfig) -> QuaConfig:
+    copy = QuaConfig()
+    copy.CopyFrom(config)
+    return copy
+
+
+def _read(cache_dir: str, key: str) -> Optional[QuaConfig]:
+    try:
+        with open(os.path.join(cache_dir, key + ".pb"), "rb") as file:
+            return QuaConfig.FromString(file.read())
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        logger.debug(f"ignoring unreadable cached config {key}: {error}")
+        return None
+
+
+def _write(cache_dir: str, key: str, config: QuaConfig):
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(config.SerializeToString())
+        os.replace(temp_path, os.path.join(cache_dir, key + ".pb"))
+    except OSError as error:
+        logger.debug(f"could not cache config {key} on disk: {error}")
+
+
+def cached_load(config, load: Callable[[dict], QuaConfig]) -> QuaConfig:
+    """
+    Load `config` with `load`, unless a config with the same content was loaded before
+
+    :return: A copy of the loaded config, owned by the caller
+    """
+    key = config_hash(config)
+    if key is None:
+        return load(config)
+
+    with _lock:
+        loaded = _in_memory.get(key)
+        if loaded is not None:
+            _in_memory.move_to_end(key)
+            return _copy(loaded)
+
+    cache_dir = _cache_dir
+    loaded = _read(cache_dir, key) if cache_dir is not None else None
+    if loaded is None:
+        loaded = load(config)
+        if cache_dir is not None:
+            _write(cache_dir, key, loaded)
+
+    with _lock:
+        _in_memory[key] = loaded
+        while len(_in_memory) > _MAX_IN_MEMORY:
+            _in_memory.popitem(last=False)
+    return _copy(loaded)
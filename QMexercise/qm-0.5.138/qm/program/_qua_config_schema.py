@@ -1,16 +1,77 @@
 
+import numpy as np
 from qm.pb.inc_qua_config_pb2 import QuaConfig
-from marshmallow import Schema, fields, post_load
+from marshmallow import Schema, ValidationError, fields, post_load
 from marshmallow_polyfield import PolyField
 from qm._logger import logger
+from qm.program._config_cache import cached_load
 
 
 def validate_config(config):
     pass
 
 
-def load_config(config):
-    return QuaConfigSchema().load(config)
+def load_config(config, use_cache=True):
+    """
+    :param config: A QM config
+    :param use_cache: Reuse the result of loading a config with the same content, skipping validation
+    :return: The config message, owned by the caller
+    """
+    if not use_cache:
+        return QuaConfigSchema().load(config)
+    return cached_load(config, QuaConfigSchema().load)
+
+
+class _FloatSamples(fields.Field):
+    """
+    A list or a numpy array of floats. Arrays and lists of plain ints and floats are validated and converted as a
+    whole, other lists item by item, accepting and rejecting the values ``fields.List(fields.Float())`` does
+    """
+
+    _items = fields.List(fields.Float())
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+            samples = value.astype(float, copy=False)
+        elif isinstance(value, list) and set(map(type, value)) <= {float, int}:
+            # a bool is not a number here, as in fields.Float, so lists holding one take the item by item path
+            samples = np.asarray(value, dtype=float)
+        else:
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+            samples = np.asarray(self._items.deserialize(value), dtype=float)
+        if samples.ndim != 1:
+            raise ValidationError("Samples must be one dimensional.")
+        if not np.isfinite(samples).all():
+            raise ValidationError("Special numeric values (nan or infinity) are not permitted.")
+        return samples
+
+
+class _DigitalSamples(fields.Field):
+    """
+    A list of (value, length) tuples, or a numpy array of shape (n, 2). Arrays of numbers are validated and
+    converted as a whole, lists item by item, accepting and rejecting the values
+    ``fields.List(fields.Tuple([fields.Int(), fields.Int()]))`` does
+    """
+
+    _items = fields.List(fields.Tuple([fields.Int(), fields.Int()]))
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+            if len(value) == 0:
+                return np.empty((0, 2), dtype=np.int64)
+            if value.ndim != 2 or value.shape[1] != 2:
+                raise ValidationError("Not a valid list of (value, length) tuples.")
+            if value.dtype.kind == "f" and not np.isfinite(value).all():
+                raise ValidationError("Not a valid integer.")
+            # truncated like int() truncates the floats fields.Int accepts
+            return value.astype(np.int64)
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        samples = self._items.deserialize(value)
+        if len(samples) == 0:
+            return np.empty((0, 2), dtype=np.int64)
+        return np.asarray(samples, dtype=np.int64)
 
 
 PortReferenceSchema = fields.Tuple(
@@ -154,10 +215,10 @@ class DigitalInputSchema(Schema):
 
 
 class IntegrationWeightSchema(Schema):
-    cosine = fields.List(fields.Float(), description='W_cosine, a fixed-point vector of integration weights, <br />'
-                                                     'range: [-2048, 2048] in steps of 2**-15')
-    sine = fields.List(fields.Float(), description='W_sine, a fixed-point vector of integration weights, <br />'
-                                                   'range: [-2048, 2048] in steps of 2**-15')
+    cosine = _FloatSamples(description='W_cosine, a fixed-point vector of integration weights, <br />'
+                                       'range: [-2048, 2048] in steps of 2**-15')
+    sine = _FloatSamples(description='W_sine, a fixed-point vector of integration weights, <br />'
+                                     'range: [-2048, 2048] in steps of 2**-15')
 
     class Meta:
         title = 'integration weights'
@@ -177,9 +238,9 @@ class IntegrationWeightSchema(Schema):
     def build(self, data, **kwargs):
         item = QuaConfig.IntegrationWeightDec()
         if "cosine" in data:
-            item.cosine.extend(data["cosine"])
+            item.cosine.extend(data["cosine"].tolist())
         if "sine" in data:
-            item.sine.extend(data["sine"])
+            item.sine.extend(data["sine"].tolist())
         return item
 
 
@@ -205,7 +266,7 @@ class ConstantWaveFormSchema(WaveFormSchema):
 
 class ArbitraryWaveFormSchema(WaveFormSchema):
     type = fields.String(description="\"arbitrary\"")
-    samples = fields.List(fields.Float(), description='list of values of arbitrary waveforms, range: (-0.5, 0.5)')
+    samples = _FloatSamples(description='list or numpy array of values of arbitrary waveforms, range: (-0.5, 0.5)')
 
     class Meta:
         title = 'arbitrary waveform'
@@ -215,7 +276,7 @@ class ArbitraryWaveFormSchema(WaveFormSchema):
     def build(self, data, **kwargs):
         item = QuaConfig.WaveformDec()
         item.arbitrary.SetInParent()
-        item.arbitrary.samples.extend(data["samples"])
+        item.arbitrary.samples.extend(data["samples"].tolist())
         return item
 
 
@@ -241,8 +302,8 @@ _waveform_poly_field = PolyField(
 
 
 class DigitalWaveFormSchema(Schema):
-    samples = fields.List(fields.Tuple([fields.Int(), fields.Int()]), description=
-    '''(list of tuples) specifying the analog data according to following code: <br />
+    samples = _DigitalSamples(description=
+    '''(list of tuples or numpy array of shape (n, 2)) specifying the analog data according to following code: <br />
     The first entry of each tuple is 0 or 1 and corresponds to the digital value, <br /> 
     and the second entry is the length in nsec to play the value, in steps of 1. <br />
     If value is 0, the value will be played to end of pulse.
@@ -255,10 +316,9 @@ class DigitalWaveFormSchema(Schema):
     @post_load(pass_many=False)
     def build(self, data, **kwargs):
         item = QuaConfig.DigitalWaveformDec()
-        for sample in data["samples"]:
-            s = item.samples.add()
-            s.value = bool(sample[0])
-            s.length = int(sample[1])
+        add = item.samples.add
+        for (value, length) in data["samples"].tolist():
+            add(value=bool(value), length=length)
         return item
 
 
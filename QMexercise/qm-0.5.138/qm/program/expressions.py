@@ -1,3 +1,5 @@
+import numpy as _np
+
 from qm.pb.inc_qua_pb2 import QuaProgram as _Q
 from qm._loc import _get_loc
 
@@ -87,6 +89,66 @@ def literal_real(value):
     return exp
 
 
+class LiteralArray(object):
+    """
+    The values of an array of literals of a single type, formatted together and sharing one location
+    """
+
+    def __init__(self, values, literal_type, loc):
+        super(LiteralArray, self).__init__()
+        self.values = values
+        self.type = literal_type
+        self.loc = loc
+
+    def __len__(self):
+        return len(self.values)
+
+
+_LITERAL_TYPES = {int: _Q.INT, bool: _Q.BOOL, float: _Q.REAL}
+_LITERAL_KINDS = {"i": _Q.INT, "u": _Q.INT, "b": _Q.BOOL, "f": _Q.REAL}
+
+
+def literal_array(values):
+    """
+    Literals of a numpy array, or of a list of python values of one type
+
+    :param values: A 1d array or a list of int, float or bool, python or numpy scalars
+    :return: A ``LiteralArray``, or None if the values do not all have the same supported type
+    """
+    if isinstance(values, _np.ndarray):
+        if values.ndim != 1:
+            raise Exception("array values must be one dimensional")
+        literal_type = _LITERAL_KINDS.get(values.dtype.kind)
+        if literal_type is None:
+            return None
+        # tolist gives python scalars, so the literals are formatted exactly like the ones of single values
+        values = values.tolist()
+    else:
+        types = set(map(type, values))
+        if any(issubclass(value_type, _np.generic) for value_type in types):
+            # numpy scalars are literals of their python value, as in literal_array_type
+            values = [value.item() if isinstance(value, _np.generic) else value for value in values]
+            types = set(map(type, values))
+        if len(types) != 1:
+            return None
+        literal_type = _LITERAL_TYPES.get(types.pop())
+        if literal_type is None:
+            return None
+    return LiteralArray(list(map(str, values)), literal_type, _get_loc())
+
+
+def literal_array_type(values):
+    """
+    :return: The literal type of the values of a numpy array or a list, by its first value
+    """
+    if isinstance(values, _np.ndarray):
+        return _LITERAL_KINDS.get(values.dtype.kind)
+    first = values[0]
+    if isinstance(first, _np.generic):
+        first = first.item()
+    return _LITERAL_TYPES.get(type(first))
+
+
 def io1():
     exp = _Q.AnyScalarExpression()
     exp.variable.ioNumber = 1
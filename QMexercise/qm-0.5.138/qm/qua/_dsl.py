@@ -9,6 +9,7 @@ from qm.utils import fix_object_data_type as _fix_object_data_type
 from qm.pb.inc_qua_pb2 import QuaProgram as _Q
 from qm.program.StatementsCollection import StatementsCollection as _StatementsCollection
 from qm.program._ResultAnalysis import _ResultAnalysis, _ResultSymbol
+from qm.program._ProgramTemplate import placeholder_loc as _placeholder_loc
 from qm.qua import AnalogMeasureProcess
 from qm.qua._measure_process_dsl import demod
 from qm._deprecated import deprecated as _deprecated
@@ -648,12 +649,15 @@ def for_each_(var, values):
         if isinstance(value, _Expression):
             arrays.append(value)
         elif _is_iter(value):
-            if type(value[0]) == int:
+            literal_type = _exp.literal_array_type(value)
+            if literal_type == _Q.INT:
                 arrays.append(declare(int, value=value))
-            elif type(value[0]) == bool:
+            elif literal_type == _Q.BOOL:
                 arrays.append(declare(bool, value=value))
-            elif type(value[0]) == float:
+            elif literal_type == _Q.REAL:
                 arrays.append(declare(fixed, value=value))
+            else:
+                raise Exception("values must be int, bool or float")
         else:
             raise Exception("value is not a Qua array neither iterable")
 
@@ -793,6 +797,30 @@ def L(value):
         raise Exception("literal can be bool, int or float")
 
 
+def placeholder(name, value):
+    """
+    A literal that can be set to a different value in a template of the program, without building the program again.
+    See ``template()`` of the program
+
+    :param name: The name the literal is bound by, it may be used in several places
+    :param value: int, float or bool, the value the program is built with. It also sets the type of the literal
+
+    Example::
+
+    >>> with program() as prog:
+    >>>     play('pulse' * amp(placeholder('a', 0.5)), 'element')
+    >>> template = prog.template()
+    >>> half = template.bind(a=0.25)
+    """
+    value = _fix_object_data_type(value)
+    if type(value) not in (bool, int, float):
+        raise Exception("placeholder can be bool, int or float")
+    result = _to_expression(value)
+    result.literal.loc = _placeholder_loc(name, result.literal.loc)
+    _get_root_program_scope().program().placeholder_added()
+    return _Expression(result)
+
+
 class fixed(object):
     pass
 
@@ -819,7 +847,7 @@ def declare(t, **kwargs):
             a signed 4.28 fixed point number
         ``bool``
             either ``True`` or ``False``
-    :key value: An initial value for the variable or a list of initial values for a vector
+    :key value: An initial value for the variable or a list or a numpy array of initial values for a vector
     :key size:
         If declaring a vector without explicitly specifying a value, this parameter is used to specify the length
         of the array
@@ -860,10 +888,14 @@ def declare(t, **kwargs):
 
     if dec_type == DeclarationType.InitArray:
         memsize = len(value)
-        new_value = []
-        for val in value:
-            new_value.append(_to_expression(val).literal)
-        value = new_value
+        literals = _exp.literal_array(value) if memsize > 0 else None
+        if literals is not None:
+            value = literals
+        else:
+            new_value = []
+            for val in value:
+                new_value.append(_to_expression(val).literal)
+            value = new_value
     elif dec_type == DeclarationType.InitScalar:
         memsize = 1
         value = _to_expression(value).literal
@@ -1,6 +1,7 @@
-
+from collections.abc import Mapping
 import numpy as np
 
+
 class SimulatorSamples(object):
     def __init__(self, controllers):
         for k, v in controllers.items():
@@ -12,27 +13,101 @@ class SimulatorSamples(object):
         for col in arr.dtype.names:
             parts = col.split(":")
             controller = controllers.setdefault(parts[0], {'analog': dict(), 'digital': dict()})
-            controller[parts[1]][parts[2]] = arr[col]
+            controller[parts[1]][parts[2]] = col
         res = dict()
         for item in controllers.items():
-            res[item[0]] = SimulatorControllerSamples(item[1]['analog'], item[1]['digital'])
+            res[item[0]] = SimulatorControllerSamples(
+                _PortSamples(arr, item[1]['analog']),
+                _PortSamples(arr, item[1]['digital'])
+            )
         return SimulatorSamples(res)
 
 
+class _PortSamples(Mapping):
+    """
+    The samples of the ports of a controller by port name.
+    Every port is a view of a column of the simulated samples array, created on access
+    """
+
+    def __init__(self, arr: np.ndarray, columns: dict):
+        self._arr = arr
+        self._columns = columns
+
+    def __getitem__(self, port):
+        return self._arr[self._columns[port]]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+
+def decimate(samples: np.ndarray, max_points: int):
+    """
+    Reduce samples for plotting, keeping the minimum and maximum of every bin so no peak is lost
+
+    :param samples: The samples, one per nanosecond
+    :param max_points: The maximum number of points returned
+    :return: The times in ns and the values, with the minimum and the maximum of each bin in time order
+    """
+    bins = max(1, max_points // 2)
+    if len(samples) <= max_points:
+        return np.arange(len(samples)), samples
+    bin_size = int(np.ceil(len(samples) / bins))
+    padding = -len(samples) % bin_size
+    values = np.asarray(samples, dtype=float)
+    if padding > 0:
+        values = np.concatenate([values, np.full(padding, values[-1])])
+    values = values.reshape(-1, bin_size)
+    argmin = values.argmin(axis=1)
+    argmax = values.argmax(axis=1)
+    rows = np.arange(len(values))
+    first = np.minimum(argmin, argmax)
+    second = np.maximum(argmin, argmax)
+    times = np.empty(2 * len(values), dtype=int)
+    times[0::2] = rows * bin_size + first
+    times[1::2] = rows * bin_size + second
+    decimated = np.empty(2 * len(values))
+    decimated[0::2] = values[rows, first]
+    decimated[1::2] = values[rows, second]
+    keep = times < len(samples)
+    return times[keep], decimated[keep]
+
+
 class SimulatorControllerSamples(object):
     def __init__(self, analog, digital):
         self.analog = analog
         self.digital = digital
 
-    def plot(self, analog_ports=None, digital_ports=None):
+    def decimated(self, max_points: int = 100000):
+        """
+        Min/max decimated views of the samples, see :func:`decimate`
+
+        :return: Dictionaries of analog and digital ports to (times in ns, values)
+        """
+        return (
+            {port: decimate(samples, max_points) for port, samples in self.analog.items()},
+            {port: decimate(samples, max_points) for port, samples in self.digital.items()},
+        )
+
+    def plot(self, analog_ports=None, digital_ports=None, max_points=100000):
+        """
+        :param max_points: Ports with more samples are plotted min/max decimated, None to plot every sample
+        """
         import matplotlib.pyplot as plt
         for port, samples in self.analog.items():
             if analog_ports is None or port in analog_ports:
-                plt.plot(samples, label=f"Analog {port}")
+                plt.plot(*self._plot_points(samples, max_points), label=f"Analog {port}")
         for port, samples in self.digital.items():
             if digital_ports is None or port in digital_ports:
-                plt.plot(samples, label=f"Digital {port}")
+                plt.plot(*self._plot_points(samples, max_points), label=f"Digital {port}")
         plt.xlabel("Time [ns]")
         plt.ylabel("ADC")
         plt.legend()
 
+    @staticmethod
+    def _plot_points(samples, max_points):
+        if max_points is None:
+            return np.arange(len(samples)), samples
+        return decimate(samples, max_points)
@@ -0,0 +1,356 @@
+"""
+Runs stream processing pipelines on this computer, over result arrays fetched from a job or loaded from a store::
+
+    with program() as prog:
+        I = declare(fixed)
+        I_stream = declare_stream()
+        ...
+        with stream_processing():
+            I_stream.save_all("I_raw")
+
+    raw = job.result_handles.get("I_raw").fetch_all()
+    processor = StreamProcessor(I_stream.buffer(100).average())
+    averaged = processor.run([(I_stream, raw)])
+
+QUA streams can not be dict keys, so the data of the sources is given as (stream, values) pairs.
+The operators of the pipeline work on whole arrays of items, and keep their state between calls of ``push``,
+so results can be processed chunk by chunk as they arrive.
+"""
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+_Items = Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]
+
+
+def _array(literal) -> np.ndarray:
+    if not isinstance(literal, list) or not literal or literal[0] != "@array":
+        raise Exception(f"expected an array, got {literal}")
+    return np.array([_array(item) if isinstance(item, list) else float(item) for item in literal[1:]])
+
+
+def _concat(pending: Optional[np.ndarray], items: np.ndarray) -> np.ndarray:
+    if pending is None or len(pending) == 0:
+        return items
+    return np.concatenate([pending, items])
+
+
+def _convolve(items: np.ndarray, kernel: np.ndarray, mode: str) -> np.ndarray:
+    # one shifted multiply-add per kernel value, over all the items at once
+    length = items.shape[-1]
+    full = np.zeros(items.shape[:-1] + (length + len(kernel) - 1,))
+    for (shift, value) in enumerate(kernel):
+        full[..., shift:shift + length] += value * items
+    return _convolution_mode(full, length, len(kernel), mode)
+
+
+def _convolution_mode(full: np.ndarray, length: int, kernel_length: int, mode: str) -> np.ndarray:
+    if mode in ("", "full"):
+        return full
+    longer = max(length, kernel_length)
+    shorter = min(length, kernel_length)
+    if mode == "same":
+        start = (shorter - 1) // 2
+        return full[..., start:start + longer]
+    if mode == "valid":
+        return full[..., shorter - 1:longer]
+    raise Exception(f"unknown convolution mode {mode}")
+
+
+class _Operator(object):
+    """An operator of a pipeline, transforming arrays of items and keeping its state between them"""
+
+    def push(self, items: _Items, last_only: bool) -> _Items:
+        raise NotImplementedError()
+
+
+class _Average(_Operator):
+    def __init__(self):
+        super(_Average, self).__init__()
+        self._sum = None
+        self._count = 0
+
+    def push(self, items, last_only):
+        items = np.asarray(items, dtype=float)
+        if len(items) == 0:
+            return items
+        if last_only:
+            total = items.sum(axis=0) + (0 if self._sum is None else self._sum)
+            self._count += len(items)
+            self._sum = total
+            return (total / self._count)[np.newaxis]
+        sums = np.cumsum(items, axis=0)
+        if self._sum is not None:
+            sums += self._sum
+        counts = self._count + np.arange(1, len(items) + 1).reshape((-1,) + (1,) * (items.ndim - 1))
+        self._sum = sums[-1]
+        self._count += len(items)
+        return sums / counts
+
+
+class _Buffer(_Operator):
+    def __init__(self, shape: List[int]):
+        super(_Buffer, self).__init__()
+        self._shape = shape
+        self._size = int(np.prod(shape))
+        self._pending = None
+
+    def push(self, items, last_only):
+        items = _concat(self._pending, items)
+        count = len(items) // self._size
+        self._pending = items[count * self._size:]
+        return items[:count * self._size].reshape((count,) + tuple(self._shape) + items.shape[1:])
+
+
+class _BufferAndSkip(_Operator):
+    def __init__(self, length: int, skip: int):
+        super(_BufferAndSkip, self).__init__()
+        self._length = length
+        self._skip = skip
+        self._pending = None
+        # the items still to skip before the next buffer starts, when it starts past the items pushed so far
+        self._offset = 0
+
+    def push(self, items, last_only):
+        items = _concat(self._pending, items)
+        skipped = min(self._offset, len(items))
+        items = items[skipped:]
+        self._offset -= skipped
+        count = max(0, (len(items) - self._length) // self._skip + 1)
+        starts = np.arange(count) * self._skip
+        start = count * self._skip
+        self._offset += max(0, start - len(items))
+        self._pending = items[start:]
+        return items[starts[:, np.newaxis] + np.arange(self._length)]
+
+
+class _Flatten(_Operator):
+    def push(self, items, last_only):
+        return items.reshape((-1,) + items.shape[2:])
+
+
+class _Skip(_Operator):
+    def __init__(self, length: int):
+        super(_Skip, self).__init__()
+        self._remaining = length
+
+    def push(self, items, last_only):
+        skipped = min(self._remaining, len(items))
+        self._remaining -= skipped
+        return items[skipped:]
+
+
+class _SkipLast(_Operator):
+    def __init__(self, length: int):
+        super(_SkipLast, self).__init__()
+        self._length = length
+        self._pending = None
+
+    def push(self, items, last_only):
+        items = _concat(self._pending, items)
+        ready = max(0, len(items) - self._length)
+        self._pending = items[ready:]
+        return items[:ready]
+
+
+class _Take(_Operator):
+    def __init__(self, length: int):
+        super(_Take, self).__init__()
+        self._remaining = length
+
+    def push(self, items, last_only):
+        taken = min(self._remaining, len(items))
+        self._remaining -= taken
+        return items[:taken]
+
+
+class _Histogram(_Operator):
+    def __init__(self, bins: np.ndarray):
+        super(_Histogram, self).__init__()
+        order = np.argsort(bins[:, 0])
+        self._order = order
+        self._low = bins[order, 0]
+        self._high = bins[order, 1]
+        self._counts = np.zeros(len(bins), dtype=np.int64)
+
+    def push(self, items, last_only):
+        values = np.asarray(items, dtype=float).reshape(len(items), -1)
+        if len(values) == 0:
+            return np.empty((0, len(self._counts)), dtype=np.int64)
+        index = np.searchsorted(self._low, values, side="right") - 1
+        inside = (index >= 0) & (values <= self._high[np.maximum(index, 0)])
+        # bins are numbered as they were given, not by their sorted order
+        bin_of = np.where(inside, self._order[np.maximum(index, 0)], len(self._counts))
+        if last_only:
+            self._counts += np.bincount(bin_of.ravel(), minlength=len(self._counts) + 1)[:-1]
+            return self._counts[np.newaxis].copy()
+        hits = np.zeros((len(values), len(self._counts) + 1), dtype=np.int64)
+        for column in range(values.shape[1]):
+            hits[np.arange(len(values)), bin_of[:, column]] += 1
+        running = np.cumsum(hits[:, :-1], axis=0) + self._counts
+        self._counts = running[-1].copy()
+        return running
+
+
+class _Map(_Operator):
+    def __init__(self, function: list):
+        super(_Map, self).__init__()
+        self._name = function[0]
+        self._args = function[1:]
+
+    def push(self, items, last_only):
+        name = self._name
+        if name == "average":
+            return np.asarray(items, dtype=float).mean(axis=-1)
+        if name == "booleancast":
+            return np.asarray(items).astype(int)
+        if name == "smult":
+            return items * float(self._args[0])
+        if name == "vmult":
+            return items * _array(self._args[0])
+        if name == "tmult":
+            return items[0] * items[1]
+        if name == "dot":
+            if self._args:
+                return items @ _array(self._args[0])
+            return (items[0] * items[1]).sum(axis=-1)
+        if name == "conv":
+            mode = self._args[0]
+            if len(self._args) > 1:
+                return _convolve(np.asarray(items, dtype=float), _array(self._args[1]), mode)
+            if len(items[0]) == 0:
+                return np.empty((0, 0))
+            return np.stack([np.convolve(a, b, mode or "full") for (a, b) in zip(items[0], items[1])])
+        if name == "fft":
+            values = np.asarray(items, dtype=float)
+            if values.ndim > 2 and values.shape[-1] == 2:
+                values = values[..., 0] + 1j * values[..., 1]
+            transformed = np.fft.fft(values, axis=-1)
+            return np.stack([transformed.real, transformed.imag], axis=-1)
+        raise Exception(f"the stream processor does not support the function {name}")
+
+
+_OPERATORS = {
+    "average": lambda args: _Average(),
+    "buffer": lambda args: _Buffer([int(arg) for arg in args]),
+    "bufferAndSkip": lambda args: _BufferAndSkip(int(args[0]), int(args[1])),
+    "flatten": lambda args: _Flatten(),
+    "skip": lambda args: _Skip(int(args[0])),
+    "skipLast": lambda args: _SkipLast(int(args[0])),
+    "take": lambda args: _Take(int(args[0])),
+    "histogram": lambda args: _Histogram(_array(args[0])),
+    "map": lambda args: _Map(args[0]),
+}
+
+
+class _Node(object):
+    def push(self, data: Dict[str, np.ndarray], last_only: bool) -> _Items:
+        raise NotImplementedError()
+
+
+class _SourceNode(_Node):
+    def __init__(self, name: str, field: str):
+        super(_SourceNode, self).__init__()
+        self.name = name
+        self.field = field
+
+    def push(self, data, last_only):
+        items = data.get(self.name)
+        if items is None:
+            return np.empty(0)
+        items = np.asarray(items)
+        if items.dtype.names is not None:
+            if self.field not in items.dtype.names:
+                raise Exception(f"the data of {self.name} has no {self.field}")
+            items = items[self.field]
+        return items
+
+
+class _OperatorNode(_Node):
+    def __init__(self, operator: _Operator, child: _Node):
+        super(_OperatorNode, self).__init__()
+        self.operator = operator
+        self.child = child
+
+    def push(self, data, last_only):
+        # only the last operator of the pipeline can skip the items that lead to the last one
+        return self.operator.push(self.child.push(data, False), last_only)
+
+
+class _ZipNode(_Node):
+    def __init__(self, first: _Node, second: _Node):
+        super(_ZipNode, self).__init__()
+        self.first = first
+        self.second = second
+        self._pending = [None, None]
+
+    def push(self, data, last_only):
+        first = _concat(self._pending[0], self.first.push(data, False))
+        second = _concat(self._pending[1], self.second.push(data, False))
+        count = min(len(first), len(second))
+        self._pending = [first[count:], second[count:]]
+        return first[:count], second[:count]
+
+
+def _compile(proto) -> _Node:
+    name = proto[0]
+    if name == "@re":
+        return _SourceNode(proto[1], "value")
+    if name in ("withoutTimestamp", "@macro_adc_trace"):
+        return _compile(proto[1])
+    if name == "onlyTimestamp":
+        node = _compile(proto[1])
+        node.field = "timestamp"
+        return node
+    if name == "@macro_input":
+        return _compile(proto[2])
+    if name == "zip":
+        return _ZipNode(_compile(proto[2]), _compile(proto[1]))
+    if name not in _OPERATORS:
+        raise Exception(f"the stream processor does not support the operator {name}")
+    return _OperatorNode(_OPERATORS[name](proto[1:-1]), _compile(proto[-1]))
+
+
+class StreamProcessor(object):
+    """
+    A stream processing pipeline, as built in a ``stream_processing()`` block, that runs on arrays of results
+
+    :param stream: The pipeline, e.g. ``I_stream.buffer(100).average()``
+    """
+
+    def __init__(self, stream):
+        super(StreamProcessor, self).__init__()
+        self._proto = stream._to_proto()
+        self._root = _compile(self._proto)
+
+    def push(self, data, last_only: bool = False) -> _Items:
+        """
+        Process more items of the sources of the pipeline, continuing from the items pushed before
+
+        :param data: The new items of every source, as a list of (source stream, values) pairs, or a dict by the
+            name of the source variable. Arrays with a ``value`` field, like the ones fetched from ``save_all``
+            results, are processed by their values
+        :param last_only: Only compute the latest item, like ``save`` does, instead of every item like ``save_all``.
+            This lets running averages and histograms skip the intermediate items
+        :return: The items of the pipeline output produced by the new data
+        """
+        pairs = data.items() if isinstance(data, dict) else data
+        data = {self._source_name(source): values for (source, values) in pairs}
+        items = self._root.push(data, last_only)
+        if last_only and not isinstance(items, tuple) and len(items) > 1:
+            items = items[-1:]
+        return items
+
+    def run(self, data, last_only: bool = False) -> _Items:
+        """
+        Process all the items of the sources at once, see ``push``. The pipeline starts over,
+        forgetting the items pushed or run before
+        """
+        self._root = _compile(self._proto)
+        return self.push(data, last_only)
+
+    @staticmethod
+    def _source_name(source) -> str:
+        if isinstance(source, str):
+            return source
+        return source._get_var_name()
@@ -0,0 +1,38 @@
+import numpy
+import pytest
+from marshmallow import ValidationError
+
+from qm.program._qua_config_schema import ArbitraryWaveFormSchema, DigitalWaveFormSchema
+
+
+def _samples(samples):
+    return list(ArbitraryWaveFormSchema().load({"type": "arbitrary", "samples": samples}).arbitrary.samples)
+
+
+def _digital(samples):
+    return [(sample.value, sample.length) for sample in DigitalWaveFormSchema().load({"samples": samples}).samples]
+
+
+def test_float_samples_accept_lists_arrays_and_numeric_strings():
+    assert _samples([0.1, 0, -0.25]) == [0.1, 0.0, -0.25]
+    assert _samples(numpy.array([0.1, -0.25])) == [0.1, -0.25]
+    assert _samples(["0.5", numpy.float64(0.25)]) == [0.5, 0.25]
+
+
+@pytest.mark.parametrize("samples", [[True, 0.1], [0.1, float("nan")], [[0.1, 0.2]], ["a"]])
+def test_float_samples_reject_what_float_fields_reject(samples):
+    with pytest.raises(ValidationError):
+        _samples(samples)
+
+
+def test_digital_samples_coerce_like_int_fields():
+    assert _digital([(1, 2.5)]) == [(True, 2)]
+    assert _digital([("1", "2")]) == [(True, 2)]
+    assert _digital(numpy.array([[1, 4], [0, 0]])) == [(True, 4), (False, 0)]
+    assert _digital(numpy.array([[1.0, 2.5]])) == [(True, 2)]
+
+
+@pytest.mark.parametrize("samples", [[(True, 2)], [(1, 2, 3)], [("1", "2.5")], numpy.array([[1.0, numpy.nan]])])
+def test_digital_samples_reject_what_int_fields_reject(samples):
+    with pytest.raises(ValidationError):
+        _digital(samples)
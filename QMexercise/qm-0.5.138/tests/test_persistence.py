@@ -0,0 +1,26 @@
+import grpc
+import numpy
+
+from benchmarks.fake_server import FakeQmServer
+from qm._results import JobResults
+from qm.pb.job_results_pb2_grpc import JobResultsServiceStub
+from qm.persistence import MemmapFileStore, SimpleFileStore
+
+
+def test_memmap_store_saves_results_of_a_manager_with_another_store(tmp_path):
+    values = numpy.arange(5000, dtype="<f8")
+    with FakeQmServer(chunk_size=1000) as server:
+        server.add_result("job", "I", values)
+        channel = grpc.insecure_channel(server.address)
+        try:
+            results = JobResults("job", JobResultsServiceStub(channel), SimpleFileStore(str(tmp_path / "default")))
+            store = MemmapFileStore(str(tmp_path / "mm"))
+            assert store.save_job(results) == {"I": len(values)}
+        finally:
+            channel.close()
+
+    assert not (tmp_path / "default" / "job").exists()
+    assert store.manifest("job")["I"]["count"] == len(values)
+    loaded = store.load("job", "I")
+    assert isinstance(loaded, numpy.memmap)
+    numpy.testing.assert_array_equal(loaded["value"], values)
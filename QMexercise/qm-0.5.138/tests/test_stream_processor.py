@@ -0,0 +1,48 @@
+import numpy
+
+from qm.qua import declare, declare_stream, program, save, stream_processing
+from qm.results.StreamProcessor import StreamProcessor
+
+
+def _stream():
+    with program():
+        I = declare(float)
+        I_stream = declare_stream()
+        save(I, I_stream)
+        with stream_processing():
+            I_stream.save_all("I_raw")
+    return I_stream
+
+
+def test_run_averages_buffers_of_a_stream():
+    I_stream = _stream()
+    raw = numpy.arange(12.0)
+    processor = StreamProcessor(I_stream.buffer(4).average())
+
+    averaged = processor.run([(I_stream, raw)])
+
+    buffers = raw.reshape(3, 4)
+    numpy.testing.assert_allclose(averaged, numpy.cumsum(buffers, axis=0) / numpy.arange(1, 4)[:, numpy.newaxis])
+    # run starts over instead of continuing the average
+    numpy.testing.assert_allclose(processor.run([(I_stream, raw)]), averaged)
+
+
+def test_push_continues_from_earlier_chunks():
+    I_stream = _stream()
+    raw = numpy.arange(12.0)
+    processor = StreamProcessor(I_stream.buffer(4).average())
+
+    processor.push([(I_stream, raw[:6])])
+    last = processor.push([(I_stream, raw[6:])], last_only=True)
+
+    numpy.testing.assert_allclose(last, [raw.reshape(3, 4).mean(axis=0)])
+
+
+def test_push_keeps_the_skip_of_buffers_starting_past_a_chunk():
+    I_stream = _stream()
+    raw = numpy.arange(20.0)
+    processor = StreamProcessor(I_stream.buffer_and_skip(2, 4))
+
+    buffers = [processor.push([(I_stream, raw[start:start + 5])]) for start in range(0, 20, 5)]
+
+    numpy.testing.assert_allclose(numpy.concatenate(buffers), [[0, 1], [4, 5], [8, 9], [12, 13], [16, 17]])
@@ -17,5 +17,10 @@ def Hqc(NQ, NC, drive, chi, kerrQ, kerrC):
     Hcs = [xQ, yQ, xC, yC]
     return H0, Hcs
 
+def Cqc(NQ, NC, kappaQ, kappaC):
+    aC = tensor(qeye(NQ), destroy(NC))
+    aQ = tensor(destroy(NQ), qeye(NC))
+    return [np.sqrt(2*np.pi*kappaQ) * aQ, np.sqrt(2*np.pi*kappaC) * aC]
+
 def cat(N, alpha):
     return (coherent(N, alpha) + coherent(N, -alpha)).unit()
\ No newline at end of file
@@ -1,6 +1,7 @@
 
 import scipy
-from scipy.sparse.linalg import expm
+import scipy.sparse as sp
+from scipy.sparse.linalg import expm, expm_multiply
 from scipy.special import factorial
 import numpy as np
 import functools
@@ -112,6 +113,73 @@ def grape(H0, Hcs, T, nT, psi0, psig, name, costWeight=1e-4):
         pass
     saver.show()
 
+# open system: column stacking vec(A rho B) = (B.T kron A) vec(rho)
+def spre(A): return sp.kron(sp.identity(A.shape[0]), A, format='csr')
+def spost(A): return sp.kron(A.T, sp.identity(A.shape[0]), format='csr')
+def dissipator(C):
+    CdC = C.conj().T @ C
+    return sp.kron(C.conj(), C, format='csr') - 0.5 * spre(CdC) - 0.5 * spost(CdC)
+
+def toSp(H0, Hcs, cOps, rho0, rhog):
+    H0, Hcs, cOps = sp.csr_matrix(H0.data), [sp.csr_matrix(Hci.data) for Hci in Hcs], [sp.csr_matrix(C.data) for C in cOps]
+    L0 = -1j * (spre(H0) - spost(H0))
+    for C in cOps: L0 = L0 + dissipator(C)
+    Lcs = [-1j * (spre(Hci) - spost(Hci)) for Hci in Hcs]
+    def toVec(rhos):
+        rhos = rhos if isinstance(rhos, list) else [rhos]
+        rhos = [rhok.proj() if rhok.isket else rhok for rhok in rhos]
+        return np.array([ rhok.full().flatten('F') for rhok in rhos ]).T
+    return L0, Lcs, toVec(rho0), toVec(rhog)
+
+def grapeLindblad(H0, Hcs, cOps, T, nT, rho0, rhog, name, costWeight=1e-4):
+    saver = Saver(T,name)
+    p0 = np.ones([len(Hcs), nT])
+    env = envf(nT)
+    pltCtrl(p0*env, T, 'initial pulse')
+    dt = T / nT
+    L0, Lcs, rho0, rhog = toSp(H0, Hcs, cOps, rho0, rhog)
+    print('shapes: p0 {}\t L0 {} nnz {}\t rho0 {}'.format(p0.shape, L0.shape, L0.nnz, rho0.shape))
+    nC = len(Lcs); n = L0.shape[0]
+    L0 = L0 * dt; Lcs = [Lci * dt for Lci in Lcs]
+    rhog2 = np.sum(np.abs(rhog)**2)
+    # fun
+    def fun(x):
+        p = x.reshape(p0.shape) * env
+        goal1, grad1 = costf(p)
+        goal0, grad0 = gradFun(p)
+        goal1 *= costWeight; grad1 *= costWeight
+        if goal0 / saver.goal0 < 0.5: saver.save(goal0, goal1, grad1, p)
+        goal, grad = goal0 + goal1, ( (grad0+grad1) * env ).flatten()
+        return goal, grad
+    # gradFun
+    def gradFun(p):
+        L = [ L0 + sum(p[c,t] * Lcs[c] for c in range(nC)) for t in range(nT) ]
+        # backward: lam[t] = (U[nT-1]...U[t+1])^dag rhog, independent of rho0
+        lam = np.empty([nT, n, rhog.shape[1]], dtype=complex); lam[-1] = rhog
+        for t in range(nT-1, 0, -1):
+            lam[t-1] = expm_multiply(L[t].conj().T, lam[t])
+        # forward: exp([[L, Lc],[0, L]]) = [[U, dU/dp],[0, U]], one exponential action per step for U and all dU/dp
+        rho = rho0; grad = np.empty([nC, nT])
+        zero = np.zeros([nC*n, rho0.shape[1]], dtype=complex)
+        for t in range(nT):
+            blocks = [[None]*(nC+1) for _ in range(nC+1)]
+            for c in range(nC+1): blocks[c][c] = L[t]
+            for c in range(nC): blocks[c][nC] = Lcs[c]
+            X = expm_multiply(sp.bmat(blocks, format='csr'), np.vstack([zero, rho])).reshape(nC+1, n, -1)
+            grad[:, t] = np.sum(np.conjugate(lam[t]) * X[:-1], axis=(1,2)).real / rhog2
+            rho = X[-1]
+        fid = np.sum(np.conjugate(rhog) * rho).real / rhog2
+        return 1-fid, -grad
+    # minimize
+    try:
+        s = scipy.optimize.minimize(fun, x0=p0.flatten(), method='L-BFGS-B', jac=True, options={
+            'ftol': 1e-15, 'gtol': 1e-15,
+        })
+        saver.save2(s.message)
+    except KeyboardInterrupt:
+        pass
+    saver.show()
+
 def pltCtrl(p, T, name):
     plt.title(name)
     t = np.linspace(0, T, p.shape[1])